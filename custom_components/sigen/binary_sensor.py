@@ -14,7 +14,8 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry # pylint: disable=syntax-error
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import EntityDescription, DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, DEVICE_TYPE_PLANT
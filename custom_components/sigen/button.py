@@ -10,10 +10,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .common import ac_charger_command_available, generate_sigen_entity
+from .common import ac_charger_command_available, always_available, generate_sigen_entity
 from .const import (
     DEVICE_TYPE_AC_CHARGER,
     DEVICE_TYPE_PLANT,
@@ -29,7 +29,7 @@ class SigenergyButtonEntityDescription(ButtonEntityDescription):
     """Class describing Sigenergy button entities."""
 
     press_fn: Callable[[SigenergyDataUpdateCoordinator, Optional[Any]], Coroutine[Any, Any, None]] = lambda coordinator, identifier: asyncio.sleep(0)
-    available_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = lambda data, _: True
+    available_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = always_available
 
 
 PLANT_BUTTONS: list[SigenergyButtonEntityDescription] = [
@@ -123,14 +123,20 @@ class SigenergyButton(SigenergyEntity, ButtonEntity):
             device_info=device_info,
             pv_string_idx=pv_string_idx,
         )
+        self._available_fn = (
+            None if description.available_fn is always_available else description.available_fn
+        )
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         if not super().available:
             return False
-        identifier = self._device_name
-        return self.entity_description.available_fn(self.coordinator.data, identifier)
+        if self._available_fn is None:
+            return True
+
+        # Use device_name as the primary identifier passed to the function
+        return self._available_fn(self.coordinator.data, self._device_name)
 
     async def async_press(self) -> None:
         """Press the button."""
@@ -24,7 +24,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import callback, State
 from homeassistant.helpers.event import async_track_point_in_time
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.event import async_track_state_change_event, async_call_later
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.history import state_changes_during_period
@@ -34,6 +34,7 @@ from .const import CONF_VALUES_TO_INIT, DEFAULT_MIN_INTEGRATION_TIME
 from .modbusregisterdefinitions import EMSWorkMode
 
 from .common import (
+    EMPTY_DATA,
     SigenergySensorEntityDescription,
     safe_decimal,
     safe_float,
@@ -139,7 +140,7 @@ class SigenergyCalculations:
             _LOGGER.debug("[CS][Total PV Power] Missing plant data in coordinator_data for total PV power calculation")
             return None
 
-        plant_data = coordinator_data.get("plant", {})
+        plant_data = coordinator_data.get("plant", EMPTY_DATA)
 
         plant_pv_power = safe_float(
             plant_data.get("plant_sigen_photovoltaic_power"))
@@ -178,7 +179,7 @@ class SigenergyCalculations:
                 return None
 
             # Use device_name to look up inverter data
-            inverter_data = coordinator_data.get("inverters", {}).get(device_name, {})
+            inverter_data = coordinator_data.get("inverters", EMPTY_DATA).get(device_name, EMPTY_DATA)
 
             if not inverter_data:
                 _LOGGER.warning(
@@ -344,7 +345,7 @@ class SigenergyCalculations:
                 )
 
         total_ac_charger_power = 0.0
-        ac_chargers: dict[str, Any] = coordinator_data.get("ac_chargers", {})
+        ac_chargers: dict[str, Any] = coordinator_data.get("ac_chargers", EMPTY_DATA)
         for _, ac_charger_data in ac_chargers.items():
             ac_power = safe_float(ac_charger_data.get("ac_charger_charging_power"))
             if ac_power is not None:
@@ -406,7 +407,7 @@ class SigenergyCalculations:
 
         total_energy = Decimal("0.0")
         valid_sample_count = 0
-        inverters_data = coordinator_data.get("inverters", {})
+        inverters_data = coordinator_data.get("inverters", EMPTY_DATA)
 
         if not inverters_data:
             _LOGGER.debug("[%s] Inverter data is empty", log_prefix)
@@ -629,12 +630,12 @@ class SigenergyCalculations:
         if not coordinator_data:
             return None
 
-        inverters_data = coordinator_data.get("inverters", {})
+        inverters_data = coordinator_data.get("inverters", EMPTY_DATA)
         if not inverters_data:
             _LOGGER.debug("[CS][ESS Current] No inverter data in coordinator")
             return None
 
-        device_name = (extra_params or {}).get("device_name")
+        device_name = (extra_params or EMPTY_DATA).get("device_name")
         if device_name and device_name in inverters_data:
             candidates = {device_name: inverters_data[device_name]}
         else:
@@ -996,12 +997,12 @@ class SigenergyLifetimeDailySensor(SigenergyEntity, RestoreSensor):
 
     def _get_lifetime_value(self) -> Optional[Decimal]:
         """Get the current lifetime value from coordinator data."""
-        if not hasattr(self.entity_description, 'value_fn'):
+        value_fn = getattr(self.entity_description, 'value_fn', None)
+        if value_fn is None:
             return None
             
         try:
             # Call the value function to get the current lifetime value
-            value_fn = getattr(self.entity_description, 'value_fn')
             coordinator_data = self.coordinator.data if self.coordinator else None
             
             # Get extra_fn_data flag and extra_params
@@ -1013,9 +1014,9 @@ class SigenergyLifetimeDailySensor(SigenergyEntity, RestoreSensor):
             else:
                 # Get the raw value from coordinator data if available
                 raw_value = None
-                if coordinator_data and hasattr(self.entity_description, 'key'):
+                if coordinator_data:
                     # Try to get value from plant data first
-                    plant_data = coordinator_data.get("plant", {})
+                    plant_data = coordinator_data.get("plant", EMPTY_DATA)
                     raw_value = plant_data.get(self.entity_description.key)
                 
                 result = value_fn(raw_value)
@@ -1724,7 +1725,7 @@ class SigenergyCalculatedSensors:
     """Class for holding calculated sensor methods."""
 
     # Lifetime-based daily energy sensors (require special handling)
-    PLANT_LIFETIME_DAILY_SENSORS = [
+    PLANT_LIFETIME_DAILY_SENSORS = (
         SigenergySensorEntityDescription(
             key="plant_daily_grid_import_energy",
             name="Daily Grid Import Energy",
@@ -1772,9 +1773,9 @@ class SigenergyCalculatedSensors:
             suggested_display_precision=2,
             round_digits=6,
         ),
-    ]
+    )
 
-    PV_STRING_SENSORS = [
+    PV_STRING_SENSORS = (
         SigenergySensorEntityDescription(
             key="power",
             name="Power",
@@ -1787,9 +1788,9 @@ class SigenergyCalculatedSensors:
             round_digits=6,
             icon="mdi:solar-power",
         ),
-    ]
+    )
 
-    PLANT_SENSORS = [
+    PLANT_SENSORS = (
         # System time and timezone
         SigenergySensorEntityDescription(
             key="plant_system_time",
@@ -1939,9 +1940,9 @@ class SigenergyCalculatedSensors:
             suggested_display_precision=2,
             round_digits=6, # Match other energy sensors
         ),
-    ]
+    )
 
-    INVERTER_SENSORS = [
+    INVERTER_SENSORS = (
         SigenergySensorEntityDescription(
             key="inverter_startup_time",
             name="Startup Time",
@@ -1978,21 +1979,21 @@ class SigenergyCalculatedSensors:
             extra_fn_data=True,
             entity_registry_enabled_default=False,
         ),
-    ]
+    )
 
-    AC_CHARGER_SENSORS = []
+    AC_CHARGER_SENSORS = ()
 
-    DC_CHARGER_SENSORS = []
+    DC_CHARGER_SENSORS = ()
 
     # Add the plant integration sensors list
-    PLANT_INTEGRATION_SENSORS = [
-    ]
+    PLANT_INTEGRATION_SENSORS = (
+    )
 
     # Add the inverter integration sensors list
-    INVERTER_INTEGRATION_SENSORS = [
-    ]
+    INVERTER_INTEGRATION_SENSORS = (
+    )
     # Integration sensors for individual PV strings (dynamically created)
-    PV_INTEGRATION_SENSORS = [
+    PV_INTEGRATION_SENSORS = (
         SigenergySensorEntityDescription(
             key="pv_string_accumulated_energy", # Template key
             name="Accumulated Energy", # Template name
@@ -2022,5 +2023,5 @@ class SigenergyCalculatedSensors:
             max_sub_interval=timedelta(seconds=30),
             icon="mdi:solar-power",
         ),
-    ]
+    )
 
@@ -4,33 +4,96 @@ from __future__ import annotations
 import logging
 from datetime import timedelta
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional, Callable, Dict
+from functools import lru_cache
+from typing import Any, Optional, Callable, Dict, Sequence
 from dataclasses import dataclass
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 
-from .const import (DOMAIN, DEVICE_TYPE_INVERTER, DEVICE_TYPE_DC_CHARGER)
+from .const import (
+    DOMAIN,
+    DEVICE_TYPE_PLANT,
+    DEVICE_TYPE_INVERTER,
+    DEVICE_TYPE_AC_CHARGER,
+    DEVICE_TYPE_DC_CHARGER,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coordinator data section holding the per-device values of each device type.
+DEVICE_TYPE_DATA_KEYS: Dict[str, str] = {
+    DEVICE_TYPE_INVERTER: "inverters",
+    DEVICE_TYPE_AC_CHARGER: "ac_chargers",
+    DEVICE_TYPE_DC_CHARGER: "dc_chargers",
+}
+
+# Shared fallback for missing data sections; never mutated.
+EMPTY_DATA: Dict[str, Any] = {}
+
+
+def device_data_selector(
+    device_type: str, device_name: str
+) -> Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]:
+    """Return a function selecting a device's values from coordinator data."""
+    if device_type == DEVICE_TYPE_PLANT:
+        return lambda data: (data or EMPTY_DATA).get("plant", EMPTY_DATA)
+    section = DEVICE_TYPE_DATA_KEYS.get(device_type)
+    if section is None:
+        return lambda data: EMPTY_DATA
+    return lambda data: (data or EMPTY_DATA).get(section, EMPTY_DATA).get(device_name, EMPTY_DATA)
+
+
+# Marks a cached value that has not been computed from any coordinator data yet.
+_NOT_COMPUTED = object()
+
+
+class CoordinatorDataCache:
+    """Value computed from a coordinator data snapshot, recomputed when the data is replaced.
+
+    The coordinator swaps in a new data dict on every refresh and never mutates it,
+    while HA reads entity state far more often than that.
+    """
+
+    __slots__ = ("_compute", "_data", "_value")
+
+    def __init__(self, compute: Callable[[Optional[Dict[str, Any]]], Any]) -> None:
+        """Initialize the cache with the function computing the value."""
+        self._compute = compute
+        self._data: Any = _NOT_COMPUTED
+        self._value: Any = None
+
+    def get(self, data: Optional[Dict[str, Any]]) -> Any:
+        """Return the value for data, computing it only for a new data snapshot."""
+        if data is not self._data:
+            self._value = self._compute(data)
+            self._data = data
+        return self._value
+
+
+def always_available(data: Dict[str, Any], identifier: Optional[Any]) -> bool:
+    """Default available_fn of entity descriptions; entities skip calling it altogether."""
+    return True
+
 
 def ac_charger_command_available(data: Dict[str, Any], identifier: Optional[Any]) -> bool:
     """Return if AC charger start/stop commands should be exposed."""
-    state = data.get("ac_chargers", {}).get(identifier, {}).get("ac_charger_system_state")
+    state = data.get("ac_chargers", EMPTY_DATA).get(identifier, EMPTY_DATA).get("ac_charger_system_state")
     return state is not None and state not in (0, 1)
 
 
 def get_suffix_if_not_one(name: str) -> str:
     """Get the last part of the name if it is a number other than 1."""
-    return name.split()[-1].strip() + " " if len(name.split()) > 1 and name.split()[-1].isdigit() and name.split()[-1] != "1" else ""
+    parts = name.rsplit(None, 1)
+    return parts[1] + " " if len(parts) > 1 and parts[1].isdigit() and parts[1] != "1" else ""
 
 def generate_device_name(plant_name: str, device_name: str) -> str:
     """Generate a device name based on plant name and device name."""
-    device_type = " ".join(device_name.split()[:-1]) if len(device_name.split()) > 1 and device_name.split()[-1].isdigit() else device_name
+    parts = device_name.rsplit(None, 1)
+    device_type = parts[0].strip() if len(parts) > 1 and parts[1].isdigit() else device_name
     return f"Sigen {get_suffix_if_not_one(plant_name)}{device_type}{get_suffix_if_not_one(device_name)}"
 
 def generate_sigen_entity(
@@ -39,7 +102,7 @@ def generate_sigen_entity(
         device_conn: dict | None,
         coordinator,
         entity_class: type,
-        entity_description: list,
+        entity_description: Sequence,
         device_type: str,
         hass: Optional[HomeAssistant] = None,
         device_info: Optional[DeviceInfo] = None,
@@ -62,43 +125,46 @@ def generate_sigen_entity(
     """
     device_name = device_name if device_name else plant_name
 
+    # All entities of one call belong to the same device; build its DeviceInfo once.
+    # A failure here would fail every entity of the device, so skip them all.
+    if device_info is None and pv_string_idx is None and entity_description:
+        try:
+            device_info = generate_device_info(device_type, device_name, coordinator)
+        except Exception as ex: # pylint: disable=broad-exception-caught
+            _LOGGER.exception(
+                "Error creating device info for device '%s' (type: %s), skipping its entities: %s",
+                device_name, device_type, ex)
+            return []
+
+    # Resolve the per-device name prefix and device ID once for all descriptions.
+    # PV string value_fn parameters are supplied by the entity, so the
+    # shared description is used as-is.
+    shared_device_id: Optional[str] = None
+    if pv_string_idx is not None:
+        name_prefix = f"{device_name} PV{pv_string_idx}"
+        shared_device_id = generate_device_id(name_prefix, device_type)
+    elif device_type == DEVICE_TYPE_DC_CHARGER:
+        # Check if device_name already contains "DC Charger" to avoid double naming
+        name_prefix = device_name if "DC Charger" in device_name else f"{device_name} DC Charger"
+        shared_device_id = generate_device_id(name_prefix, device_type)
+    else:
+        name_prefix = device_name
+
     entities = []
     for description in entity_description:
-        # _LOGGER.debug("Generating entity for description: %s", description.name)
-
-        # Generate PV specific entity names and IDs if applicable
-        if pv_string_idx is not None:
-            # Add extra parameters for PV string index and device name to the description if needed
-            if hasattr(description, "value_fn") and description.value_fn is not None:
-                description = SigenergySensorEntityDescription.from_entity_description(
-                    description,
-                    extra_params={"pv_idx": pv_string_idx, "device_name": device_name},
-                )
-
-            pv_string_name = f"{device_name} PV{pv_string_idx}"
-            sensor_name = f"{pv_string_name} {description.name}"
-            sensor_id = pv_string_name
-        elif device_type == DEVICE_TYPE_DC_CHARGER:
-            # Check if device_name already contains "DC Charger" to avoid double naming
-            if "DC Charger" in device_name:
-                sensor_id = device_name
-            else:
-                sensor_id = f"{device_name} DC Charger"
-            sensor_name = f"{sensor_id} {description.name}"
-        else:
-            sensor_name = f"{device_name} {description.name}"
-            sensor_id = sensor_name
+        sensor_name = f"{name_prefix} {description.name}"
 
         entity_kwargs = {
             "coordinator": coordinator,
             "description": description,
             "name": sensor_name,
             "device_type": device_type,
-            "device_id": generate_device_id(sensor_id, device_type),
+            # Other devices derive the ID from the full entity name
+            "device_id": shared_device_id or generate_device_id(sensor_name, device_type),
             "device_name": device_name,
         }
 
-        if hasattr(description, 'source_key') and description.source_key:
+        if getattr(description, 'source_key', None):
             source_entity_id = get_source_entity_id(
                 device_type,
                 device_name,
@@ -188,20 +254,73 @@ def generate_unique_entity_id(
     # Use the device name if available, otherwise use the device type
     unique_device_part = generate_device_id(device_name, device_type)
     if pv_string_idx is not None:
-        unique_id = f"{coordinator.hub.config_entry.entry_id}_{unique_device_part}_pv{pv_string_idx}_{attr_key}"
-    else:
-        unique_id = f"{coordinator.hub.config_entry.entry_id}_{unique_device_part}_{attr_key}"
-
-    return unique_id
+        return f"{coordinator.hub.config_entry.entry_id}_{unique_device_part}_pv{pv_string_idx}_{attr_key}"
+    return f"{coordinator.hub.config_entry.entry_id}_{unique_device_part}_{attr_key}"
 
+# Called for every entity of a device with the same few names, so memoize the slug.
+@lru_cache(maxsize=None)
 def generate_device_id(
     device_name: str | None,
     device_type: Optional[str] = None,
 ) -> str:
     """Generate a unique device ID based on the device name and type."""
-    unique_device_part = str(device_name).lower().replace(' ', '_') if device_name else device_type
+    unique_device_part = device_name.lower().replace(' ', '_') if device_name else device_type
     return unique_device_part if unique_device_part else "unknown_device_id"
 
+def _inverter_model_info(device_name: str, coordinator) -> Dict[str, Any]:
+    """Return the model details of an inverter from coordinator data."""
+    inverter_data = (coordinator.data or EMPTY_DATA).get("inverters", EMPTY_DATA).get(device_name, EMPTY_DATA)
+    return {
+        "model": inverter_data.get("inverter_model_type", "Sigen Inverter"),
+        "serial_number": inverter_data.get("inverter_serial_number"),
+        "sw_version": inverter_data.get("inverter_machine_firmware_version"),
+    }
+
+
+def _ac_charger_model_info(device_name: str, coordinator) -> Dict[str, Any]:
+    """Return the model details of an AC charger."""
+    return {"model": "AC Charger"}
+
+
+def _dc_charger_model_info(device_name: str, coordinator) -> Dict[str, Any]:
+    """Return the model details of a DC charger."""
+    return {"model": "DC Charger"}
+
+
+# Model details per non-plant device type; SigenergyEntity rejects unknown types.
+_DEVICE_MODEL_INFO: Dict[str, Callable[[str, Any], Dict[str, Any]]] = {
+    DEVICE_TYPE_INVERTER: _inverter_model_info,
+    DEVICE_TYPE_AC_CHARGER: _ac_charger_model_info,
+    DEVICE_TYPE_DC_CHARGER: _dc_charger_model_info,
+}
+
+
+def generate_device_info(
+    device_type: str,
+    device_name: str,
+    coordinator,
+) -> DeviceInfo:
+    """Generate device information for a Sigenergy device."""
+    config_entry_id = coordinator.hub.config_entry.entry_id
+    plant_device_identifier = coordinator.hub.plant_device_identifier
+
+    if device_type == DEVICE_TYPE_PLANT:
+        return DeviceInfo(
+            identifiers={plant_device_identifier},
+            name=device_name,
+            manufacturer="Sigenergy",
+            model="Energy Storage System",
+        )
+
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{config_entry_id}_{generate_device_id(device_name)}")},
+        name=device_name,
+        manufacturer="Sigenergy",
+        via_device=plant_device_identifier,
+        **_DEVICE_MODEL_INFO[device_type](device_name, coordinator),
+    )
+
+
 @dataclass(frozen=True)
 class SigenergySensorEntityDescription(SensorEntityDescription):
     """Class describing Sigenergy sensor entities."""
@@ -15,7 +15,7 @@ import voluptuous as vol
 from homeassistant import (
     config_entries,
 )
-from homeassistant.const import CONF_NAME
+from homeassistant.const import CONF_NAME, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import callback
 from homeassistant.config_entries import (  # pylint: disable=syntax-error
     ConfigFlowResult,
@@ -1127,9 +1127,11 @@ class SigenergyOptionsFlowHandler(config_entries.OptionsFlow):
                 if not current_value:
                     _LOGGER.debug("Sensor %s not found in states", sensor)
                     current_value = 0.0
+                elif current_value.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                    current_value = 0.0
                 else:
                     val = safe_float(current_value.state)
-                    if val is None or val == "unknown":
+                    if val is None:
                         current_value = 0.0
                     else:
                         current_value = val #* 1000  # Convert to kWh
@@ -63,6 +63,8 @@ DEFAULT_SCAN_INTERVAL = 5
 DEFAULT_INVERTER_COUNT = 1
 DEFAULT_READ_ONLY = True  # Default to read-only mode
 DEFAULT_MIN_INTEGRATION_TIME = 1  # Minimum integration time in seconds
+WRITE_REFRESH_COOLDOWN = 0.5  # Seconds to wait after a write before refreshing
+STALE_DEVICE_DATA_POLLS = 2  # Failed polls a device keeps its previous values for
 
 # Platforms
 PLATFORMS = ["sensor", "switch", "select", "number", "binary_sensor", "button"]
@@ -8,11 +8,18 @@ from typing import Any, Dict, Optional, Union # Added Optional, Union
 
 import async_timeout
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed  # pylint: disable=syntax-error
 from homeassistant.util import dt as dt_util
 
 from .modbus import SigenergyModbusHub, SigenergyModbusError # Added SigenergyModbusError
-from .const import CONF_INVERTER_HAS_DCCHARGER, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DEVICE_TYPE_PLANT,
+    STALE_DEVICE_DATA_POLLS,
+    WRITE_REFRESH_COOLDOWN,
+)
+from .common import DEVICE_TYPE_DATA_KEYS, EMPTY_DATA
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +41,8 @@ class SigenergyDataUpdateCoordinator(DataUpdateCoordinator):
         self.largest_update_interval : float = 0.0
         self.latest_fetch_time: float = 0.0
         self.data: dict[str, Any] | None = None
+        # Consecutive failed reads per (data section, device name)
+        self._device_read_failures: dict[tuple[str, str], int] = {}
 
         if scan_interval <= 1:
             scan_interval = DEFAULT_SCAN_INTERVAL
@@ -44,6 +53,14 @@ class SigenergyDataUpdateCoordinator(DataUpdateCoordinator):
             logger,
             name=name,
             update_interval=timedelta(seconds=scan_interval),
+            # Coalesce the refreshes requested by a burst of parameter writes
+            # (e.g. several number entities changed in a row) into one poll.
+            request_refresh_debouncer=Debouncer(
+                hass,
+                logger,
+                cooldown=WRITE_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
 
     async def _async_update_data(self) -> Dict[str, Any]:
@@ -62,36 +79,23 @@ class SigenergyDataUpdateCoordinator(DataUpdateCoordinator):
                 }
                 dc_tasks = {
                     name: asyncio.create_task(self.hub.async_read_dc_charger_data(name))
-                    for name, cfg in self.hub.inverter_connections.items()
-                    if cfg.get(CONF_INVERTER_HAS_DCCHARGER, False)
+                    for name in self.hub.dc_charger_connections
                 }
-                inverter_data: dict[str, Any] = {}
-                for name, task in inverter_tasks.items():
-                    try:
-                        inverter_data[name] = await task
-                    except Exception as e:
-                        _LOGGER.error("Error fetching inverter %s data: %s", name, e)
-                        inverter_data[name] = {}
-                dc_charger_data: dict[str, Any] = {}
-                for name, task in dc_tasks.items():
-                    try:
-                        dc_charger_data[name] = await task
-                    except Exception as e:
-                        _LOGGER.error("Error fetching DC charger %s data: %s", name, e)
-                        dc_charger_data[name] = {}
+                inverter_data = await self._collect_device_data(
+                    "inverters", "inverter", inverter_tasks
+                )
+                dc_charger_data = await self._collect_device_data(
+                    "dc_chargers", "DC charger", dc_tasks
+                )
 
                 # Fetch AC charger data concurrently
                 ac_tasks = {
                     name: asyncio.create_task(self.hub.async_read_ac_charger_data(name))
                     for name in self.hub.ac_charger_connections
                 }
-                ac_charger_data: dict[str, Any] = {}
-                for name, task in ac_tasks.items():
-                    try:
-                        ac_charger_data[name] = await task
-                    except Exception as e:
-                        _LOGGER.error("Error fetching AC charger %s data: %s", name, e)
-                        ac_charger_data[name] = {}
+                ac_charger_data = await self._collect_device_data(
+                    "ac_chargers", "AC charger", ac_tasks
+                )
 
                 # Merge fetched data into existing coordinator data
                 # Preserve the _sensors_initialized flag across updates
@@ -127,6 +131,36 @@ class SigenergyDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as exception:
             raise UpdateFailed(f"Error communicating with Sigenergy system: {exception}") from exception
 
+    async def _collect_device_data(
+        self, section: str, kind: str, tasks: Dict[str, asyncio.Task]
+    ) -> dict[str, Any]:
+        """Await per-device read tasks and return their data keyed by device name.
+
+        A device whose read fails keeps its previous values for up to
+        STALE_DEVICE_DATA_POLLS consecutive polls, so a single Modbus glitch does
+        not flip all of its entities to unknown and back.
+        """
+        previous = (self.data or EMPTY_DATA).get(section, EMPTY_DATA)
+        device_data: dict[str, Any] = {}
+        for name, task in tasks.items():
+            failure_key = (section, name)
+            try:
+                device_data[name] = await task
+                self._device_read_failures.pop(failure_key, None)
+            except Exception as e:
+                failures = self._device_read_failures.get(failure_key, 0) + 1
+                self._device_read_failures[failure_key] = failures
+                if failures <= STALE_DEVICE_DATA_POLLS and previous.get(name):
+                    _LOGGER.warning(
+                        "Error fetching %s %s data, keeping previous values (%d/%d): %s",
+                        kind, name, failures, STALE_DEVICE_DATA_POLLS, e,
+                    )
+                    device_data[name] = previous[name]
+                else:
+                    _LOGGER.error("Error fetching %s %s data: %s", kind, name, e)
+                    device_data[name] = {}
+        return device_data
+
     async def async_write_parameter(
         self,
         device_type: str,
@@ -136,13 +170,16 @@ class SigenergyDataUpdateCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Write a parameter via the Modbus hub and schedule a update."""
         try:
-            await self.hub.async_write_parameter(
+            new_value = await self.hub.async_write_parameter(
                 device_type=device_type,
                 device_identifier=device_identifier,
                 register_name=register_name,
                 value=value,
             )
-            # Trigger an immediate refresh
+            # Show the read-back value right away; the (debounced) refresh still
+            # follows, since other values may depend on the written parameter.
+            if new_value is not None:
+                self._apply_written_value(device_type, device_identifier, register_name, new_value)
             await self.async_request_refresh()
         except SigenergyModbusError as ex:
             _LOGGER.error("Failed to write parameter %s to %s '%s': %s",
@@ -155,6 +192,33 @@ class SigenergyDataUpdateCoordinator(DataUpdateCoordinator):
             # Re-raise for visibility
             raise
 
+    def _apply_written_value(
+        self,
+        device_type: str,
+        device_identifier: Optional[str],
+        register_name: str,
+        value: Union[int, float, str],
+    ) -> None:
+        """Store a read-back parameter value in the data and notify entities."""
+        if self.data is None:
+            return
+        if device_type == DEVICE_TYPE_PLANT:
+            data = {**self.data, "plant": {**self.data.get("plant", EMPTY_DATA), register_name: value}}
+        else:
+            section_key = DEVICE_TYPE_DATA_KEYS.get(device_type)
+            section = self.data.get(section_key) if section_key else None
+            if not section or device_identifier not in section:
+                return
+            data = {
+                **self.data,
+                section_key: {
+                    **section,
+                    device_identifier: {**section[device_identifier], register_name: value},
+                },
+            }
+        # Copy rather than mutate so entities comparing data identity see the change
+        self.async_set_updated_data(data)
+
     def mark_sensors_initialized(self) -> None:
         """Mark that static sensors have been initialized and calculated sensors can run."""
         if self.data is not None:
@@ -94,13 +94,15 @@ async def async_get_config_entry_diagnostics(
         
         # Add device-specific data from coordinator
         if coordinator.data:
+            # Slug of the device name, matched against each data section name below
+            device_slug = device_name.lower().replace(" ", "_")
             if device_type == "plant":
                 device_diagnostics["device_data"] = async_redact_data(coordinator.data.get("plant", {}), TO_REDACT)
             elif device_type == "inverter":
                 # Find the inverter data by matching device name patterns
                 inverter_data = {}
                 for inv_name, inv_data in coordinator.data.get("inverters", {}).items():
-                    if device_name.lower().replace(" ", "_") in inv_name.lower().replace(" ", "_"):
+                    if device_slug in inv_name.lower().replace(" ", "_"):
                         inverter_data = inv_data
                         break
                 device_diagnostics["device_data"] = async_redact_data(inverter_data, TO_REDACT)
@@ -108,7 +110,7 @@ async def async_get_config_entry_diagnostics(
                 # Find AC charger data
                 ac_charger_data = {}
                 for ac_name, ac_data in coordinator.data.get("ac_chargers", {}).items():
-                    if device_name.lower().replace(" ", "_") in ac_name.lower().replace(" ", "_"):
+                    if device_slug in ac_name.lower().replace(" ", "_"):
                         ac_charger_data = ac_data
                         break
                 device_diagnostics["device_data"] = async_redact_data(ac_charger_data, TO_REDACT)
@@ -116,7 +118,7 @@ async def async_get_config_entry_diagnostics(
                 # Find DC charger data  
                 dc_charger_data = {}
                 for dc_name, dc_data in coordinator.data.get("dc_chargers", {}).items():
-                    if device_name.lower().replace(" ", "_") in dc_name.lower().replace(" ", "_"):
+                    if device_slug in dc_name.lower().replace(" ", "_"):
                         dc_charger_data = dc_data
                         break
                 device_diagnostics["device_data"] = async_redact_data(dc_charger_data, TO_REDACT)
@@ -18,6 +18,7 @@ from pymodbus import __version__ as pymodbus_version
 
 from .const import (
     CONF_INVERTER_CONNECTIONS,
+    CONF_INVERTER_HAS_DCCHARGER,
     CONF_AC_CHARGER_CONNECTIONS,
     CONF_PLANT_ID,
     CONF_SLAVE_ID,
@@ -27,6 +28,7 @@ from .const import (
     CONF_PLANT_CONNECTION,
     DEFAULT_PLANT_SLAVE_ID,
     DEFAULT_READ_ONLY,
+    DOMAIN,
 )
 from .modbusregisterdefinitions import (
     DataType,
@@ -167,6 +169,8 @@ class SigenergyModbusHub:
         """Initialize the Modbus hub."""
         self.hass = hass
         self.config_entry = config_entry
+        # Device registry identifier of the plant, the via_device of every other device
+        self.plant_device_identifier = (DOMAIN, f"{config_entry.entry_id}_plant")
 
         # Log to dev logger the version of pymodbus being used
         _LOGGER.debug("Using pymodbus version: %s", pymodbus_version)
@@ -191,6 +195,12 @@ class SigenergyModbusHub:
         _LOGGER.debug("Inverter connections: %s", self.inverter_connections)
         self.inverter_count = len(self.inverter_connections)
 
+        # Inverters hosting a DC Charger, resolved once instead of by every platform and poll
+        self.dc_charger_connections = {
+            name: conn for name, conn in self.inverter_connections.items()
+            if conn.get(CONF_INVERTER_HAS_DCCHARGER, False)
+        }
+
         # Get AC Charger connections
         self.ac_charger_connections = config_entry.data.get(CONF_AC_CHARGER_CONNECTIONS, {})
         _LOGGER.debug("AC Charger connections: %s", self.ac_charger_connections)
@@ -633,8 +643,12 @@ class SigenergyModbusHub:
         address: int,
         value: int,
         register_type: RegisterType
-    ) -> None:
-        """Write a single register to the Modbus device."""
+    ) -> int:
+        """Write a single register to the Modbus device.
+
+        Returns the address the write succeeded at, which is the offset
+        address when only offset addressing was accepted.
+        """
         try:
             slave_id_value = device_info.get(CONF_SLAVE_ID)
             if slave_id_value is None:
@@ -723,7 +737,7 @@ class SigenergyModbusHub:
                     # Check if any approach succeeded
                     if success:
                         _LOGGER.debug("Successfully wrote to register at address %s", address)
-                        return
+                        return approach["address"]
 
                     # If we've tried all approaches and still have an error
                     self._connected[key] = False
@@ -758,8 +772,8 @@ class SigenergyModbusHub:
         address: int,
         values: List[int],
         register_type: RegisterType
-    ) -> None:
-        """Write multiple registers to the Modbus device."""
+    ) -> int:
+        """Write multiple registers to the Modbus device and return the address written."""
         try:
             slave_id_value = device_info.get(CONF_SLAVE_ID)
             if slave_id_value is None:
@@ -789,8 +803,8 @@ class SigenergyModbusHub:
                         raise SigenergyModbusError(
                             f"Error writing registers at address {address}: {result if not tried_offset else last_error}, {result}"
                         )
-                    else:
-                        _LOGGER.debug("Successfully wrote to registers at address %s", address)
+                    _LOGGER.debug("Successfully wrote to registers at address %s", address)
+                    return address
                 else:
                     raise SigenergyModbusError(
                         f"Register type {register_type} is not writable"
@@ -1196,7 +1210,7 @@ class SigenergyModbusHub:
         device_identifier: Optional[str],
         register_name: str,
         value: Union[int, float, str]
-    ) -> None:
+    ) -> Optional[Union[int, float, str]]:
         """Write a parameter to a specified device (plant, inverter, or AC charger).
 
         Args:
@@ -1205,6 +1219,10 @@ class SigenergyModbusHub:
             register_name: The name of the parameter register to write.
             value: The value to write to the register.
 
+        Returns:
+            The decoded value read back from the register after the write, or None if
+            nothing was written or the register could not be read back.
+
         Raises:
             SigenergyModbusError: If writing is disabled (read-only mode), the device/parameter
                                   is unknown, slave ID is missing, or a Modbus error occurs.
@@ -1212,7 +1230,7 @@ class SigenergyModbusHub:
         """
         if self.read_only:
             _LOGGER.error("Cannot write parameter while in read-only mode")
-            return
+            return None
 
         slave_id: Optional[int] = None
         parameter_registers: Dict[str, ModbusRegisterDefinition] = {}
@@ -1302,14 +1320,14 @@ class SigenergyModbusHub:
         # Use the existing high-level write methods which handle locks/clients internally
         try:
             if len(encoded_values) == 1:
-                await self.async_write_register(
+                written_address = await self.async_write_register(
                     device_info=device_info, # Pass the correctly typed device_info
                     address=register_def.address,
                     value=encoded_values[0],
                     register_type=register_def.register_type,
                 )
             else:
-                await self.async_write_registers(
+                written_address = await self.async_write_registers(
                     device_info=device_info, # Pass the correctly typed device_info
                     address=register_def.address,
                     values=encoded_values,
@@ -1318,4 +1336,27 @@ class SigenergyModbusHub:
         except SigenergyModbusError as ex:
             _LOGGER.error("Failed to write %s parameter '%s' (device: %s): %s",
                           device_type, register_name, device_identifier or 'plant', ex)
-            raise # Re-raise the specific error
\ No newline at end of file
+            raise # Re-raise the specific error
+
+        # Read the register back so the caller can update its state before the next poll.
+        # Read from the address the write succeeded at, which may be the offset address.
+        if register_def.register_type == RegisterType.WRITE_ONLY:
+            return None
+        try:
+            registers = await self.async_read_registers(
+                device_info=device_info,
+                address=written_address,
+                count=register_def.count,
+                register_type=register_def.register_type,
+            )
+            if not registers or len(registers) != register_def.count:
+                return None
+            return self._decode_value(
+                registers=registers,
+                data_type=register_def.data_type,
+                gain=register_def.gain,
+            )
+        except SigenergyModbusError as ex:
+            _LOGGER.debug("Could not read back %s parameter '%s' (device: %s): %s",
+                          device_type, register_name, device_identifier or 'plant', ex)
+            return None
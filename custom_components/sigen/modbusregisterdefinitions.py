@@ -1,6 +1,7 @@
 """Constants for the Sigenergy ESS integration."""
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from enum import Enum, IntEnum
 from typing import Optional
@@ -1872,9 +1873,9 @@ PLANT_ESS_PREHEATING_REGISTERS = {
     ),
 }
 
-# Add the 30 TOU slots
+# Add the 30 TOU slots (names are built at runtime, so intern them like literal keys)
 for i in range(1, 31):
-    PLANT_ESS_PREHEATING_REGISTERS[f"plant_ess_preheating_tou_{i}_start_time"] = ModbusRegisterDefinition(
+    PLANT_ESS_PREHEATING_REGISTERS[sys.intern(f"plant_ess_preheating_tou_{i}_start_time")] = ModbusRegisterDefinition(
         address=50003 + (i - 1) * 6,
         count=2,
         register_type=RegisterType.HOLDING,
@@ -1883,7 +1884,7 @@ for i in range(1, 31):
         unit="s",
         description=f"ESS preheating TOU slot {i} start time (Epoch seconds)",
     )
-    PLANT_ESS_PREHEATING_REGISTERS[f"plant_ess_preheating_tou_{i}_end_time"] = ModbusRegisterDefinition(
+    PLANT_ESS_PREHEATING_REGISTERS[sys.intern(f"plant_ess_preheating_tou_{i}_end_time")] = ModbusRegisterDefinition(
         address=50005 + (i - 1) * 6,
         count=2,
         register_type=RegisterType.HOLDING,
@@ -1892,7 +1893,7 @@ for i in range(1, 31):
         unit="s",
         description=f"ESS preheating TOU slot {i} end time (Epoch seconds)",
     )
-    PLANT_ESS_PREHEATING_REGISTERS[f"plant_ess_preheating_tou_{i}_target_power"] = ModbusRegisterDefinition(
+    PLANT_ESS_PREHEATING_REGISTERS[sys.intern(f"plant_ess_preheating_tou_{i}_target_power")] = ModbusRegisterDefinition(
         address=50007 + (i - 1) * 6,
         count=2,
         register_type=RegisterType.HOLDING,
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import logging
-import asyncio
+import sys
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Coroutine
+from itertools import chain
+from typing import Any, Callable, Dict, Optional
 
 from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberEntityDescription, NumberMode
 # from homeassistant.components.sensor import SensorDeviceClass
@@ -19,7 +20,7 @@ from homeassistant.const import (
     UnitOfReactivePower,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.exceptions import HomeAssistantError
 
@@ -29,11 +30,16 @@ from .const import (
     DEVICE_TYPE_PLANT,
     DEVICE_TYPE_DC_CHARGER,
     DOMAIN,
-    CONF_INVERTER_HAS_DCCHARGER,
 )
 from .coordinator import SigenergyDataUpdateCoordinator # Import coordinator
 # from .modbus import SigenergyModbusError
-from .common import(generate_sigen_entity) # Added generate_device_id
+from .common import (
+    CoordinatorDataCache,
+    always_available,
+    device_data_selector,
+    generate_device_id,
+    generate_sigen_entity,
+)
 from .sigen_entity import SigenergyEntity # Import the new base class
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,17 +49,20 @@ _LOGGER = logging.getLogger(__name__)
 class SigenergyNumberEntityDescription(NumberEntityDescription):
     """Class describing Sigenergy number entities."""
 
-    # Provide default lambdas instead of None to satisfy type checker
-    # The second argument 'identifier' will be device_name for inverters, device_id otherwise
-    value_fn: Callable[[Dict[str, Any], Optional[Any]], float] = lambda data, identifier: 0.0
-    # Make set_value_fn async and update type hint
-    # Make set_value_fn async and update type hint to accept coordinator
-    set_value_fn: Callable[[SigenergyDataUpdateCoordinator, Optional[Any], float], Coroutine[Any, Any, None]] = lambda coordinator, identifier, value: asyncio.sleep(0) # Placeholder async lambda
-    available_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = lambda data, _: True
+    # The value is read from and written to the register named by `key` on the entity's device.
+    value_divisor: float = 1  # Divide the coordinator value by this before display
+    write_as_int: bool = False  # Convert the value to int before writing
+    max_value_keys: tuple[str, ...] = ()  # Registers whose smallest value caps native_max_value
+    available_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = always_available
     entity_registry_enabled_default: bool = True
 
 
-PLANT_NUMBERS = [
+def _independent_phase_power_control_enabled(data: Dict[str, Any], _: Optional[Any]) -> bool:
+    """Return True if per-phase power targets are in effect."""
+    return data["plant"].get("plant_independent_phase_power_control_enable") == 1
+
+
+PLANT_NUMBERS = (
     SigenergyNumberEntityDescription(
         key="plant_active_power_fixed_target",
         name="Active Power Fixed Adjustment",
@@ -64,8 +73,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_active_power_fixed_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_active_power_fixed_target", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -79,8 +86,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_reactive_power_fixed_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_reactive_power_fixed_target", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -93,8 +98,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_active_power_percentage_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_active_power_percentage_target", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -107,8 +110,6 @@ PLANT_NUMBERS = [
         native_max_value=60,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_qs_ratio_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_qs_ratio_target", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -120,8 +121,6 @@ PLANT_NUMBERS = [
         native_max_value=1,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_power_factor_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_power_factor_target", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -135,8 +134,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_ess_max_charging_limit", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_ess_max_charging_limit", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -150,8 +147,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_ess_max_discharging_limit", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_ess_max_discharging_limit", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -165,8 +160,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_pv_max_power_limit", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_pv_max_power_limit", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -181,8 +174,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_grid_point_maximum_export_limitation", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_grid_point_maximum_export_limitation", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -197,8 +188,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_grid_maximum_import_limitation", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_grid_maximum_import_limitation", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -212,8 +201,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_pcs_maximum_export_limitation", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_pcs_maximum_export_limitation", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -227,8 +214,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_pcs_maximum_import_limitation", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_pcs_maximum_import_limitation", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -241,9 +226,7 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_a_active_power_fixed_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_a_active_power_fixed_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -256,9 +239,7 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_b_active_power_fixed_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_b_active_power_fixed_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -271,9 +252,7 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_c_active_power_fixed_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_c_active_power_fixed_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -287,9 +266,7 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_a_reactive_power_fixed_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_a_reactive_power_fixed_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -303,9 +280,7 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_b_reactive_power_fixed_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_b_reactive_power_fixed_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -319,9 +294,7 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_c_reactive_power_fixed_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_c_reactive_power_fixed_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -334,9 +307,7 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_a_active_power_percentage_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_a_active_power_percentage_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -349,9 +320,7 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_b_active_power_percentage_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_b_active_power_percentage_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -364,9 +333,7 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_c_active_power_percentage_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_c_active_power_percentage_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -379,9 +346,7 @@ PLANT_NUMBERS = [
         native_max_value=60,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_a_qs_ratio_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_a_qs_ratio_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -394,9 +359,7 @@ PLANT_NUMBERS = [
         native_max_value=60,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_b_qs_ratio_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_b_qs_ratio_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -409,9 +372,7 @@ PLANT_NUMBERS = [
         native_max_value=60,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_phase_c_qs_ratio_target", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_phase_c_qs_ratio_target", value),
-        available_fn=lambda data, _: data["plant"].get("plant_independent_phase_power_control_enable") == 1,
+        available_fn=_independent_phase_power_control_enabled,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -425,8 +386,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_backup_soc", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_backup_soc", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -439,8 +398,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_charge_cut_off_soc", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_charge_cut_off_soc", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -453,8 +410,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_discharge_cut_off_soc", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_discharge_cut_off_soc", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -468,8 +423,6 @@ PLANT_NUMBERS = [
         native_max_value=5,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_active_power_regulation_gradient", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_active_power_regulation_gradient", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -481,8 +434,6 @@ PLANT_NUMBERS = [
         native_max_value=10,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_lvrt_reactive_power_comp_factor", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_lvrt_reactive_power_comp_factor", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -494,8 +445,6 @@ PLANT_NUMBERS = [
         native_max_value=10,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_lvrt_neg_seq_reactive_power_comp_factor", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_lvrt_neg_seq_reactive_power_comp_factor", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -507,8 +456,6 @@ PLANT_NUMBERS = [
         native_max_value=10,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_hvrt_reactive_power_comp_factor", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_hvrt_reactive_power_comp_factor", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -520,8 +467,6 @@ PLANT_NUMBERS = [
         native_max_value=10,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_hvrt_neg_seq_reactive_power_comp_factor", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_hvrt_neg_seq_reactive_power_comp_factor", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -534,8 +479,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_over_freq_derating_power_ramp_rate", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_over_freq_derating_power_ramp_rate", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -548,8 +491,6 @@ PLANT_NUMBERS = [
         native_max_value=72,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_over_freq_derating_trigger_freq", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_over_freq_derating_trigger_freq", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -562,8 +503,6 @@ PLANT_NUMBERS = [
         native_max_value=72,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_over_freq_derating_cutoff_freq", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_over_freq_derating_cutoff_freq", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -576,8 +515,6 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_under_freq_power_boost_power_ramp_rate", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_under_freq_power_boost_power_ramp_rate", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -590,8 +527,6 @@ PLANT_NUMBERS = [
         native_max_value=72,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_under_freq_power_boost_trigger_freq", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_under_freq_power_boost_trigger_freq", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -604,8 +539,6 @@ PLANT_NUMBERS = [
         native_max_value=72,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_under_freq_power_boost_cutoff_freq", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_under_freq_power_boost_cutoff_freq", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -617,8 +550,6 @@ PLANT_NUMBERS = [
         native_max_value=1,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_pcc_power_factor_grid_import", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_pcc_power_factor_grid_import", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -630,8 +561,6 @@ PLANT_NUMBERS = [
         native_max_value=1,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_pcc_power_factor_grid_export", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_pcc_power_factor_grid_export", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -644,48 +573,44 @@ PLANT_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, _: data["plant"].get("plant_ess_preheating_reserved_soc", 0),
-        set_value_fn=lambda coordinator, _, value: coordinator.async_write_parameter("plant", None, "plant_ess_preheating_reserved_soc", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
-]
+)
+
 
-# Add the 30 TOU slot numbers dynamically (start_time, end_time, target_power)
-for i in range(1, 31):
-    PLANT_NUMBERS.append(
+def _tou_slot_numbers(i: int) -> tuple[SigenergyNumberEntityDescription, ...]:
+    """Return the start time, end time and target power numbers of a TOU slot.
+
+    Keys are interned so they share identity with the coordinator data keys.
+    """
+    return (
         SigenergyNumberEntityDescription(
-            key=f"plant_ess_preheating_tou_{i}_start_time",
+            key=sys.intern(f"plant_ess_preheating_tou_{i}_start_time"),
             name=f"ESS Preheating TOU Slot {i} Start Time",
             icon="mdi:clock-start",
             native_min_value=0,
             native_max_value=2147483647,
             native_step=1,
             entity_category=EntityCategory.CONFIG,
-            value_fn=lambda data, _, slot=i: data["plant"].get(f"plant_ess_preheating_tou_{slot}_start_time", 0),
-            set_value_fn=lambda coordinator, _, value, slot=i: coordinator.async_write_parameter("plant", None, f"plant_ess_preheating_tou_{slot}_start_time", int(value)),
+            write_as_int=True,
             entity_registry_enabled_default=False,
             mode=NumberMode.BOX,
-        )
-    )
-    PLANT_NUMBERS.append(
+        ),
         SigenergyNumberEntityDescription(
-            key=f"plant_ess_preheating_tou_{i}_end_time",
+            key=sys.intern(f"plant_ess_preheating_tou_{i}_end_time"),
             name=f"ESS Preheating TOU Slot {i} End Time",
             icon="mdi:clock-end",
             native_min_value=0,
             native_max_value=2147483647,
             native_step=1,
             entity_category=EntityCategory.CONFIG,
-            value_fn=lambda data, _, slot=i: data["plant"].get(f"plant_ess_preheating_tou_{slot}_end_time", 0),
-            set_value_fn=lambda coordinator, _, value, slot=i: coordinator.async_write_parameter("plant", None, f"plant_ess_preheating_tou_{slot}_end_time", int(value)),
+            write_as_int=True,
             entity_registry_enabled_default=False,
             mode=NumberMode.BOX,
-        )
-    )
-    PLANT_NUMBERS.append(
+        ),
         SigenergyNumberEntityDescription(
-            key=f"plant_ess_preheating_tou_{i}_target_power",
+            key=sys.intern(f"plant_ess_preheating_tou_{i}_target_power"),
             name=f"ESS Preheating TOU Slot {i} Target Power",
             icon="mdi:radiator",
             device_class=NumberDeviceClass.POWER,
@@ -694,14 +619,16 @@ for i in range(1, 31):
             native_max_value=100,
             native_step=0.001,
             entity_category=EntityCategory.CONFIG,
-            value_fn=lambda data, _, slot=i: data["plant"].get(f"plant_ess_preheating_tou_{slot}_target_power", 0),
-            set_value_fn=lambda coordinator, _, value, slot=i: coordinator.async_write_parameter("plant", None, f"plant_ess_preheating_tou_{slot}_target_power", value),
             entity_registry_enabled_default=False,
             mode=NumberMode.BOX,
-        )
+        ),
     )
 
-INVERTER_NUMBERS = [
+
+# Add the 30 TOU slot numbers (start_time, end_time, target_power)
+PLANT_NUMBERS += tuple(chain.from_iterable(_tou_slot_numbers(i) for i in range(1, 31)))
+
+INVERTER_NUMBERS = (
     SigenergyNumberEntityDescription(
         key="inverter_active_power_fixed_adjustment",
         name="Active Power Fixed Adjustment",
@@ -712,9 +639,6 @@ INVERTER_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        # Use identifier (device_name for inverters)
-        value_fn=lambda data, identifier: data["inverters"].get(identifier, {}).get("inverter_active_power_fixed_adjustment", 0),
-        set_value_fn=lambda coordinator, identifier, value: coordinator.async_write_parameter("inverter", identifier, "inverter_active_power_fixed_adjustment", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -728,9 +652,6 @@ INVERTER_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        # Use identifier (device_name for inverters)
-        value_fn=lambda data, identifier: data["inverters"].get(identifier, {}).get("inverter_reactive_power_fixed_adjustment", 0),
-        set_value_fn=lambda coordinator, identifier, value: coordinator.async_write_parameter("inverter", identifier, "inverter_reactive_power_fixed_adjustment", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -743,9 +664,6 @@ INVERTER_NUMBERS = [
         native_max_value=100,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        # Use identifier (device_name for inverters)
-        value_fn=lambda data, identifier: data["inverters"].get(identifier, {}).get("inverter_active_power_percentage_adjustment", 0),
-        set_value_fn=lambda coordinator, identifier, value: coordinator.async_write_parameter("inverter", identifier, "inverter_active_power_percentage_adjustment", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -758,9 +676,6 @@ INVERTER_NUMBERS = [
         native_max_value=60,
         native_step=0.01,
         entity_category=EntityCategory.CONFIG,
-        # Use identifier (device_name for inverters)
-        value_fn=lambda data, identifier: data["inverters"].get(identifier, {}).get("inverter_reactive_power_qs_adjustment", 0),
-        set_value_fn=lambda coordinator, identifier, value: coordinator.async_write_parameter("inverter", identifier, "inverter_reactive_power_qs_adjustment", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
@@ -772,32 +687,28 @@ INVERTER_NUMBERS = [
         native_max_value=1,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        # Use identifier (device_name for inverters)
-        value_fn=lambda data, identifier: data["inverters"].get(identifier, {}).get("inverter_power_factor_adjustment", 0) / 1000,
-        set_value_fn=lambda coordinator, identifier, value: coordinator.async_write_parameter("inverter", identifier, "inverter_power_factor_adjustment", value),
+        value_divisor=1000,
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
-]
-AC_CHARGER_NUMBERS = [
+)
+AC_CHARGER_NUMBERS = (
     SigenergyNumberEntityDescription(
         key="ac_charger_output_current",
         name="Charger Output Current",
         icon="mdi:current-ac",
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         native_min_value=6,
-        native_max_value=32,  # This will be adjusted dynamically based on rated current
+        native_max_value=32,  # Capped at setup by the rated and input breaker currents
         native_step=1,
+        max_value_keys=("ac_charger_rated_current", "ac_charger_input_breaker_rated_current"),
         entity_category=EntityCategory.CONFIG,
-        # identifier here will be ac_charger_name
-        value_fn=lambda data, identifier: data["ac_chargers"].get(identifier, {}).get("ac_charger_output_current", 0),
-        set_value_fn=lambda coordinator, identifier, value: coordinator.async_write_parameter("ac_charger", identifier, "ac_charger_output_current", value),
         entity_registry_enabled_default=False,
         mode=NumberMode.BOX,
     ),
-]
+)
 
-DC_CHARGER_NUMBERS = [
+DC_CHARGER_NUMBERS = (
     SigenergyNumberEntityDescription(
         key="dc_charger_max_charging_power_limit",
         name="Max Charging Power Limit",
@@ -808,8 +719,6 @@ DC_CHARGER_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, identifier: data["dc_chargers"].get(identifier, {}).get("dc_charger_max_charging_power_limit", 0),
-        set_value_fn=lambda coordinator, identifier, value: coordinator.async_write_parameter("dc_charger", identifier, "dc_charger_max_charging_power_limit", value),
         mode=NumberMode.BOX,
     ),
     SigenergyNumberEntityDescription(
@@ -822,11 +731,9 @@ DC_CHARGER_NUMBERS = [
         native_max_value=100,
         native_step=0.001,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data, identifier: data["dc_chargers"].get(identifier, {}).get("dc_charger_max_discharging_power_limit", 0),
-        set_value_fn=lambda coordinator, identifier, value: coordinator.async_write_parameter("dc_charger", identifier, "dc_charger_max_discharging_power_limit", value),
         mode=NumberMode.BOX,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -839,57 +746,78 @@ async def async_setup_entry(
         hass.data[DOMAIN][config_entry.entry_id]["coordinator"])
     plant_name = config_entry.data[CONF_NAME]
 
-    # Add plant numbers
-    entities : list[SigenergyNumber] = generate_sigen_entity(plant_name, None, None, coordinator,
-                                                             SigenergyNumber,
-                                                             PLANT_NUMBERS,
-                                                             DEVICE_TYPE_PLANT)
-
-    # Add inverter numbers
-    for device_name, device_conn in coordinator.hub.inverter_connections.items():
-        entities += generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
-                                           SigenergyNumber,
-                                           INVERTER_NUMBERS,
-                                           DEVICE_TYPE_INVERTER)
-
-    # Add AC charger numbers
-    for device_name, device_conn in coordinator.hub.ac_charger_connections.items():
-        entities += generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
-                                           SigenergyNumber,
-                                           AC_CHARGER_NUMBERS,
-                                           DEVICE_TYPE_AC_CHARGER)
-
-    # Add DC Charger numbers
-    for device_name, device_conn in coordinator.hub.inverter_connections.items():
-        if device_conn.get(CONF_INVERTER_HAS_DCCHARGER, False):
-            from .common import generate_device_id
-            dc_name = f"{device_name} DC Charger"
-            parent_inverter_id = f"{coordinator.hub.config_entry.entry_id}_{generate_device_id(device_name)}"
-            dc_id = f"{parent_inverter_id}_dc_charger"
-            dc_device_info = DeviceInfo(
-                identifiers={(DOMAIN, dc_id)},
-                name=dc_name,
-                manufacturer="Sigenergy",
-                model="DC Charger",
-                via_device=(DOMAIN, parent_inverter_id),
-            )
-            entities += generate_sigen_entity(
-                plant_name,
-                device_name,
-                device_conn,
-                coordinator,
-                SigenergyNumber,
-                DC_CHARGER_NUMBERS,
-                DEVICE_TYPE_DC_CHARGER,
-                device_info=dc_device_info,
-            )
+    hub = coordinator.hub
+
+    def _dc_charger_entities(device_name: str, device_conn: dict) -> list[SigenergyNumber]:
+        """Create the DC charger numbers hosted by an inverter."""
+        dc_name = f"{device_name} DC Charger"
+        parent_inverter_id = f"{hub.config_entry.entry_id}_{generate_device_id(device_name)}"
+        dc_id = f"{parent_inverter_id}_dc_charger"
+        dc_device_info = DeviceInfo(
+            identifiers={(DOMAIN, dc_id)},
+            name=dc_name,
+            manufacturer="Sigenergy",
+            model="DC Charger",
+            via_device=(DOMAIN, parent_inverter_id),
+        )
+        return generate_sigen_entity(
+            plant_name,
+            device_name,
+            device_conn,
+            coordinator,
+            SigenergyNumber,
+            DC_CHARGER_NUMBERS,
+            DEVICE_TYPE_DC_CHARGER,
+            device_info=dc_device_info,
+        )
 
-    async_add_entities(entities)
+    # Stream the per-device entity lists straight into HA instead of
+    # concatenating them into one intermediate list first.
+    async_add_entities(chain(
+        # Plant numbers
+        generate_sigen_entity(plant_name, None, None, coordinator,
+                              SigenergyNumber,
+                              PLANT_NUMBERS,
+                              DEVICE_TYPE_PLANT),
+        # Inverter numbers
+        chain.from_iterable(
+            generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
+                                  SigenergyNumber,
+                                  INVERTER_NUMBERS,
+                                  DEVICE_TYPE_INVERTER)
+            for device_name, device_conn in hub.inverter_connections.items()
+        ),
+        # AC charger numbers
+        chain.from_iterable(
+            generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
+                                  SigenergyNumber,
+                                  AC_CHARGER_NUMBERS,
+                                  DEVICE_TYPE_AC_CHARGER)
+            for device_name, device_conn in hub.ac_charger_connections.items()
+        ),
+        # DC charger numbers
+        chain.from_iterable(
+            _dc_charger_entities(device_name, device_conn)
+            for device_name, device_conn in hub.dc_charger_connections.items()
+        ),
+    ))
 
 
 class SigenergyNumber(SigenergyEntity, NumberEntity): # pylint: disable=abstract-method
     """Representation of a Sigenergy number."""
 
+    # Slot-stored attributes, see SigenergyEntity.__slots__.
+    __slots__ = (
+        "_select_device_data",
+        "_data_key",
+        "_value_cache",
+        "_available_fn",
+        "_available_cache",
+        "_value_divisor",
+        "_write_as_int",
+        "_write_identifier",
+    )
+
     entity_description: SigenergyNumberEntityDescription
     # Explicitly type coordinator here
     coordinator: SigenergyDataUpdateCoordinator
@@ -917,46 +845,88 @@ class SigenergyNumber(SigenergyEntity, NumberEntity): # pylint: disable=abstract
             device_info=device_info,
             pv_string_idx=pv_string_idx,
         )
-        # No number-specific init needed for now
+        self._select_device_data = device_data_selector(device_type, device_name or "")
+        self._data_key = description.key
+        self._value_cache = CoordinatorDataCache(self._compute_native_value)
+        self._available_fn = (
+            None if description.available_fn is always_available else description.available_fn
+        )
+        self._available_cache = CoordinatorDataCache(self._compute_available)
+        self._value_divisor = description.value_divisor
+        self._write_as_int = description.write_as_int
+        # Plant registers are written without a device identifier
+        self._write_identifier = None if device_type == DEVICE_TYPE_PLANT else device_name
+
+        # Rated limits are static, so resolve the effective maximum once here
+        # rather than on every read of native_max_value.
+        if description.max_value_keys and coordinator.data is not None:
+            device_data = self._select_device_data(coordinator.data)
+            limits = [
+                limit for key in description.max_value_keys
+                if (limit := device_data.get(key))
+            ]
+            if limits:
+                self._attr_native_max_value = max(
+                    description.native_min_value,
+                    min(description.native_max_value, *limits),
+                )
 
     @property
     def native_value(self) -> float | None:
         """Return the value of the number."""
-        if self.coordinator.data is None:
-            return None
-            
-        # Use device_name as the primary identifier passed to the lambda/function
-        identifier = self._device_name
+        return self._value_cache.get(self.coordinator.data)
+
+    def _compute_native_value(self, data: Optional[Dict[str, Any]]) -> float | None:
+        """Compute the value of the number from coordinator data."""
+        # The data selector tolerates missing coordinator data, and the entity
+        # is unavailable in that case anyway, so no explicit None guard here.
         try:
-            value = self.entity_description.value_fn(self.coordinator.data, identifier)
+            value = self._select_device_data(data).get(self._data_key, 0)
+            if value is None:
+                return 0.0
+            if self._value_divisor != 1:
+                value = value / self._value_divisor
             # Ensure the value is a float
-            return float(value) if value is not None else 0.0
+            return float(value)
         except (TypeError, ValueError, KeyError) as e:
             _LOGGER.error(
                 "Error getting native value for %s (identifier: %s): %s",
                 self.entity_id,
-                identifier,
+                self._device_name,
                 e,
             )
             return None
 
-
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         if not super().available:
             return False
-            
-        # Use device_name as the primary identifier passed to the lambda/function
-        identifier = self._device_name
-        return self.entity_description.available_fn(self.coordinator.data, identifier)
+        if self._available_fn is None:
+            return True
+
+        return self._available_cache.get(self.coordinator.data)
+
+    def _compute_available(self, data: Optional[Dict[str, Any]]) -> bool:
+        """Evaluate the description's available_fn against coordinator data."""
+        # Use device_name as the primary identifier passed to the function
+        return self._available_fn(data, self._device_name)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value of the number."""
         if self.coordinator.data is None:
             raise HomeAssistantError(f"Cannot set value for {self.entity_id}: Coordinator data is unavailable")
 
-        # Use device_name as the primary identifier passed to the lambda/function
-        identifier = self._device_name
+        # Reject out-of-range values locally rather than after a Modbus round trip
+        min_value, max_value = self.native_min_value, self.native_max_value
+        if not min_value <= value <= max_value:
+            raise HomeAssistantError(
+                f"Cannot set value for {self.entity_id}: {value} is outside [{min_value}, {max_value}]"
+            )
+
+        if self._write_as_int:
+            value = int(value)
         # Exceptions are handled and logged in coordinator.async_write_parameter
-        await self.entity_description.set_value_fn(self.coordinator, identifier, value)
\ No newline at end of file
+        await self.coordinator.async_write_parameter(
+            self._device_type, self._write_identifier, self._data_key, value
+        )
\ No newline at end of file
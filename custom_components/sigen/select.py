@@ -3,14 +3,16 @@ from __future__ import annotations
 
 import logging
 import asyncio
+import sys
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any, Callable, Dict, Optional, Coroutine
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry  #pylint: disable=no-name-in-module, syntax-error
 from homeassistant.const import CONF_NAME, EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.exceptions import HomeAssistantError
 
@@ -23,7 +25,7 @@ from .const import (
 from .modbusregisterdefinitions import (RemoteEMSControlMode)
 from .coordinator import SigenergyDataUpdateCoordinator # Import coordinator
 # from .modbus import SigenergyModbusError
-from .common import generate_sigen_entity # Added generate_device_id
+from .common import CoordinatorDataCache, always_available, device_data_selector, generate_sigen_entity
 from .sigen_entity import SigenergyEntity # Import the new base class
 
 _LOGGER = logging.getLogger(__name__)
@@ -83,26 +85,108 @@ _LOGGER = logging.getLogger(__name__)
 #         return f"Unknown ({grid_code})"
 
 
+# Register value to option maps, and their reverse for writes, built once at import.
+# Enum members are stored as plain ints so register lookups and writes skip the IntEnum wrapper.
+_REMOTE_EMS_CONTROL_MODE_OPTIONS: Dict[int, str] = {
+    int(RemoteEMSControlMode.PCS_REMOTE_CONTROL): "PCS Remote Control",
+    int(RemoteEMSControlMode.STANDBY): "Standby",
+    int(RemoteEMSControlMode.MAXIMUM_SELF_CONSUMPTION): "Maximum Self Consumption",
+    int(RemoteEMSControlMode.COMMAND_CHARGING_GRID_FIRST): "Command Charging (Grid First)",
+    int(RemoteEMSControlMode.COMMAND_CHARGING_PV_FIRST): "Command Charging (PV First)",
+    int(RemoteEMSControlMode.COMMAND_DISCHARGING_PV_FIRST): "Command Discharging (PV First)",
+    int(RemoteEMSControlMode.COMMAND_DISCHARGING_ESS_FIRST): "Command Discharging (ESS First)",
+    int(RemoteEMSControlMode.V2G): "V2G",
+}
+_REMOTE_EMS_CONTROL_MODE_VALUES: Dict[str, int] = {
+    option: mode for mode, option in _REMOTE_EMS_CONTROL_MODE_OPTIONS.items()
+}
+
+_LVRT_MODE_OPTIONS: Dict[int, str] = {
+    0: "Reactive power compensation current, active zero-current mode",
+    2: "Zero-current mode",
+    3: "Constant current mode",
+    4: "Reactive dynamic current, active zero-current mode",
+    5: "Reactive power compensation current, active constant-current mode",
+}
+_LVRT_MODE_VALUES: Dict[str, int] = {option: mode for mode, option in _LVRT_MODE_OPTIONS.items()}
+
+_HVRT_MODE_OPTIONS: Dict[int, str] = {
+    0: "Reactive power compensation current, active zero-current mode",
+    2: "Zero-current mode",
+    3: "Constant current mode",
+    4: "Reactive dynamic current, active hold mode",
+    5: "Reactive power compensation current, active constant-current mode",
+}
+_HVRT_MODE_VALUES: Dict[str, int] = {option: mode for mode, option in _HVRT_MODE_OPTIONS.items()}
+
+
+def _options(*options: str) -> tuple[str, ...]:
+    """Return select options as a tuple of interned strings."""
+    return tuple(sys.intern(option) for option in options)
+
+
+def _option_getter(
+    key: str, options: Dict[Any, str], default: str
+) -> Callable[[Dict[str, Any], Optional[Any]], str]:
+    """Return a current_option_fn mapping a device register value to its option."""
+    # Interned so the reported option is the same object as the entry in `options`
+    options = {value: sys.intern(option) for value, option in options.items()}
+    default = sys.intern(default)
+
+    def current_option(device_data: Dict[str, Any], _: Optional[Any]) -> str:
+        return options.get(device_data.get(key), default)
+    return current_option
+
+
+def _plant_option_setter(
+    key: str, values: Dict[str, int], default: int
+) -> Callable[[SigenergyDataUpdateCoordinator, Optional[Any], str], Coroutine[Any, Any, None]]:
+    """Return a select_option_fn writing the register value of an option to a plant register."""
+    # Interned like the options tuple, so lookups of a chosen option match by identity
+    values = {sys.intern(option): value for option, value in values.items()}
+
+    def select_option(
+        coordinator: SigenergyDataUpdateCoordinator, _: Optional[Any], option: str
+    ) -> Coroutine[Any, Any, None]:
+        return coordinator.async_write_parameter("plant", None, key, values.get(option, default))
+    return select_option
+
+
+def _no_current_option(device_data: Dict[str, Any], _: Optional[Any]) -> str:
+    """Default current_option_fn."""
+    return ""
+
+
+async def _no_select_option(
+    coordinator: SigenergyDataUpdateCoordinator, _: Optional[Any], option: str
+) -> None:
+    """Default select_option_fn; writes nothing."""
+
+
+def _remote_ems_enabled(data: Dict[str, Any], _: Optional[Any]) -> bool:
+    """Return True if remote EMS control is enabled on the plant."""
+    return data["plant"].get("plant_remote_ems_enable") == 1
+
 
 @dataclass(frozen=True)
 class SigenergySelectEntityDescription(SelectEntityDescription):
     """Class describing Sigenergy select entities."""
 
-    # The second argument 'identifier' will be device_name for inverters, device_id otherwise. Default returns empty string.
-    current_option_fn: Callable[[Dict[str, Any], Optional[Any]], str] = lambda data, identifier: ""
-    # Make select_option_fn async and update type hint
-    # Make select_option_fn async and update type hint to accept coordinator
-    select_option_fn: Callable[[SigenergyDataUpdateCoordinator, Optional[Any], str], Coroutine[Any, Any, None]] = lambda coordinator, identifier, option: asyncio.sleep(0) # Placeholder async lambda
-    available_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = lambda data, _: True
+    # current_option_fn receives the entity's device data section (e.g. data["plant"]);
+    # the second argument 'identifier' is the device_name. Default returns empty string.
+    current_option_fn: Callable[[Dict[str, Any], Optional[Any]], str] = _no_current_option
+    # select_option_fn is async and receives the coordinator to write through
+    select_option_fn: Callable[[SigenergyDataUpdateCoordinator, Optional[Any], str], Coroutine[Any, Any, None]] = _no_select_option
+    available_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = always_available
     entity_registry_enabled_default: bool = True
 
 
-PLANT_SELECTS = [
+PLANT_SELECTS = (
     SigenergySelectEntityDescription(
         key="plant_remote_ems_control_mode",
         name="Remote EMS Control Mode",
         icon="mdi:remote",
-        options=[
+        options=_options(
             "PCS Remote Control",
             "Standby",
             "Maximum Self Consumption",
@@ -112,43 +196,26 @@ PLANT_SELECTS = [
             "Command Discharging (ESS First)",
             "V2G",
             "Unknown",
-        ],
-        current_option_fn=lambda data, _: {
-            RemoteEMSControlMode.PCS_REMOTE_CONTROL: "PCS Remote Control",
-            RemoteEMSControlMode.STANDBY: "Standby",
-            RemoteEMSControlMode.MAXIMUM_SELF_CONSUMPTION: "Maximum Self Consumption",
-            RemoteEMSControlMode.COMMAND_CHARGING_GRID_FIRST: "Command Charging (Grid First)",
-            RemoteEMSControlMode.COMMAND_CHARGING_PV_FIRST: "Command Charging (PV First)",
-            RemoteEMSControlMode.COMMAND_DISCHARGING_PV_FIRST: "Command Discharging (PV First)",
-            RemoteEMSControlMode.COMMAND_DISCHARGING_ESS_FIRST: "Command Discharging (ESS First)",
-            RemoteEMSControlMode.V2G: "V2G",
-        }.get(data["plant"].get("plant_remote_ems_control_mode"), "Unknown"),
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            "plant", None, "plant_remote_ems_control_mode",
-            {
-                "PCS Remote Control": RemoteEMSControlMode.PCS_REMOTE_CONTROL,
-                "Standby": RemoteEMSControlMode.STANDBY,
-                "Maximum Self Consumption": RemoteEMSControlMode.MAXIMUM_SELF_CONSUMPTION,
-                "Command Charging (Grid First)": RemoteEMSControlMode.COMMAND_CHARGING_GRID_FIRST,
-                "Command Charging (PV First)": RemoteEMSControlMode.COMMAND_CHARGING_PV_FIRST,
-                "Command Discharging (PV First)": RemoteEMSControlMode.COMMAND_DISCHARGING_PV_FIRST,
-                "Command Discharging (ESS First)": RemoteEMSControlMode.COMMAND_DISCHARGING_ESS_FIRST,
-                "V2G": RemoteEMSControlMode.V2G,
-            }.get(option, RemoteEMSControlMode.PCS_REMOTE_CONTROL),
         ),
-        available_fn=lambda data, _: data["plant"].get("plant_remote_ems_enable") == 1,
+        current_option_fn=_option_getter(
+            "plant_remote_ems_control_mode", _REMOTE_EMS_CONTROL_MODE_OPTIONS, "Unknown"
+        ),
+        select_option_fn=_plant_option_setter(
+            "plant_remote_ems_control_mode",
+            _REMOTE_EMS_CONTROL_MODE_VALUES,
+            int(RemoteEMSControlMode.PCS_REMOTE_CONTROL),
+        ),
+        available_fn=_remote_ems_enabled,
         entity_registry_enabled_default=False,
     ),
     SigenergySelectEntityDescription(
         key="plant_ess_preheating_mode",
         name="ESS Preheating Mode",
         icon="mdi:radiator",
-        options=["Automatic", "Manual"],
+        options=_options("Automatic", "Manual"),
         entity_category=EntityCategory.CONFIG,
-        current_option_fn=lambda data, _: "Manual" if data["plant"].get("plant_ess_preheating_mode") == 1 else "Automatic",
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            "plant", None, "plant_ess_preheating_mode", 1 if option == "Manual" else 0
-        ),
+        current_option_fn=_option_getter("plant_ess_preheating_mode", {1: "Manual"}, "Automatic"),
+        select_option_fn=_plant_option_setter("plant_ess_preheating_mode", {"Manual": 1}, 0),
         entity_registry_enabled_default=False,
     ),
     # Modbus v2.8 additions - Grid code parameters
@@ -156,149 +223,105 @@ PLANT_SELECTS = [
         key="plant_lvrt_enable",
         name="[Grid Code] LVRT Enable",
         icon="mdi:shield-check",
-        options=["Disabled", "Enabled"],
+        options=_options("Disabled", "Enabled"),
         entity_category=EntityCategory.CONFIG,
-        current_option_fn=lambda data, _: "Enabled" if data["plant"].get("plant_lvrt_enable") == 1 else "Disabled",
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            "plant", None, "plant_lvrt_enable", 1 if option == "Enabled" else 0
-        ),
+        current_option_fn=_option_getter("plant_lvrt_enable", {1: "Enabled"}, "Disabled"),
+        select_option_fn=_plant_option_setter("plant_lvrt_enable", {"Enabled": 1}, 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySelectEntityDescription(
         key="plant_lvrt_mode",
         name="[Grid Code] LVRT Mode",
         icon="mdi:cog",
-        options=[
+        options=_options(
             "Reactive power compensation current, active zero-current mode",
             "Zero-current mode",
             "Constant current mode",
             "Reactive dynamic current, active zero-current mode",
             "Reactive power compensation current, active constant-current mode",
-        ],
+        ),
         entity_category=EntityCategory.CONFIG,
-        current_option_fn=lambda data, _: {
-            0: "Reactive power compensation current, active zero-current mode",
-            2: "Zero-current mode",
-            3: "Constant current mode",
-            4: "Reactive dynamic current, active zero-current mode",
-            5: "Reactive power compensation current, active constant-current mode",
-        }.get(
-            data["plant"].get("plant_lvrt_mode"),
+        current_option_fn=_option_getter(
+            "plant_lvrt_mode",
+            _LVRT_MODE_OPTIONS,
             "Reactive power compensation current, active zero-current mode",
         ),
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            # fmt: off
-            "plant", None, "plant_lvrt_mode",
-            {
-                "Reactive power compensation current, active zero-current mode": 0,
-                "Zero-current mode": 2,
-                "Constant current mode": 3,
-                "Reactive dynamic current, active zero-current mode": 4,
-                "Reactive power compensation current, active constant-current mode": 5,
-            }.get(option, 0)
-            # fmt: on
-        ),
+        select_option_fn=_plant_option_setter("plant_lvrt_mode", _LVRT_MODE_VALUES, 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySelectEntityDescription(
         key="plant_lvrt_grid_voltage_protection_blocking",
         name="[Grid Code] LVRT Grid Voltage Protection Blocking",
         icon="mdi:shield-off",
-        options=["Not Block", "Block"],
+        options=_options("Not Block", "Block"),
         entity_category=EntityCategory.CONFIG,
-        current_option_fn=lambda data, _: "Block" if data["plant"].get("plant_lvrt_grid_voltage_protection_blocking") == 1 else "Not Block",
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            "plant", None, "plant_lvrt_grid_voltage_protection_blocking", 1 if option == "Block" else 0
-        ),
+        current_option_fn=_option_getter("plant_lvrt_grid_voltage_protection_blocking", {1: "Block"}, "Not Block"),
+        select_option_fn=_plant_option_setter("plant_lvrt_grid_voltage_protection_blocking", {"Block": 1}, 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySelectEntityDescription(
         key="plant_hvrt_enable",
         name="[Grid Code] HVRT Enable",
         icon="mdi:shield-check",
-        options=["Disabled", "Enabled"],
+        options=_options("Disabled", "Enabled"),
         entity_category=EntityCategory.CONFIG,
-        current_option_fn=lambda data, _: "Enabled" if data["plant"].get("plant_hvrt_enable") == 1 else "Disabled",
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            "plant", None, "plant_hvrt_enable", 1 if option == "Enabled" else 0
-        ),
+        current_option_fn=_option_getter("plant_hvrt_enable", {1: "Enabled"}, "Disabled"),
+        select_option_fn=_plant_option_setter("plant_hvrt_enable", {"Enabled": 1}, 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySelectEntityDescription(
         key="plant_hvrt_mode",
         name="[Grid Code] HVRT Mode",
         icon="mdi:cog",
-        options=[
+        options=_options(
             "Reactive power compensation current, active zero-current mode",
             "Zero-current mode",
             "Constant current mode",
             "Reactive dynamic current, active hold mode",
             "Reactive power compensation current, active constant-current mode",
-        ],
+        ),
         entity_category=EntityCategory.CONFIG,
-        current_option_fn=lambda data, _: {
-            0: "Reactive power compensation current, active zero-current mode",
-            2: "Zero-current mode",
-            3: "Constant current mode",
-            4: "Reactive dynamic current, active hold mode",
-            5: "Reactive power compensation current, active constant-current mode",
-        }.get(
-            data["plant"].get("plant_hvrt_mode"),
+        current_option_fn=_option_getter(
+            "plant_hvrt_mode",
+            _HVRT_MODE_OPTIONS,
             "Reactive power compensation current, active zero-current mode",
         ),
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            # fmt: off
-            "plant", None, "plant_hvrt_mode",
-            {
-                "Reactive power compensation current, active zero-current mode": 0,
-                "Zero-current mode": 2,
-                "Constant current mode": 3,
-                "Reactive dynamic current, active hold mode": 4,
-                "Reactive power compensation current, active constant-current mode": 5,
-            }.get(option, 0)
-            # fmt: on
-        ),
+        select_option_fn=_plant_option_setter("plant_hvrt_mode", _HVRT_MODE_VALUES, 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySelectEntityDescription(
         key="plant_hvrt_grid_voltage_protection_blocking",
         name="[Grid Code] HVRT Grid Voltage Protection Blocking",
         icon="mdi:shield-off",
-        options=["Not Block", "Block"],
+        options=_options("Not Block", "Block"),
         entity_category=EntityCategory.CONFIG,
-        current_option_fn=lambda data, _: "Block" if data["plant"].get("plant_hvrt_grid_voltage_protection_blocking") == 1 else "Not Block",
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            "plant", None, "plant_hvrt_grid_voltage_protection_blocking", 1 if option == "Block" else 0
-        ),
+        current_option_fn=_option_getter("plant_hvrt_grid_voltage_protection_blocking", {1: "Block"}, "Not Block"),
+        select_option_fn=_plant_option_setter("plant_hvrt_grid_voltage_protection_blocking", {"Block": 1}, 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySelectEntityDescription(
         key="plant_over_freq_derating_enable",
         name="[Grid Code] Over-Frequency Derating Enable",
         icon="mdi:sine-wave",
-        options=["Disabled", "Enabled"],
+        options=_options("Disabled", "Enabled"),
         entity_category=EntityCategory.CONFIG,
-        current_option_fn=lambda data, _: "Enabled" if data["plant"].get("plant_over_freq_derating_enable") == 1 else "Disabled",
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            "plant", None, "plant_over_freq_derating_enable", 1 if option == "Enabled" else 0
-        ),
+        current_option_fn=_option_getter("plant_over_freq_derating_enable", {1: "Enabled"}, "Disabled"),
+        select_option_fn=_plant_option_setter("plant_over_freq_derating_enable", {"Enabled": 1}, 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySelectEntityDescription(
         key="plant_under_freq_power_boost_enable",
         name="[Grid Code] Under-Frequency Power Boost Enable",
         icon="mdi:sine-wave",
-        options=["Disabled", "Enabled"],
+        options=_options("Disabled", "Enabled"),
         entity_category=EntityCategory.CONFIG,
-        current_option_fn=lambda data, _: "Enabled" if data["plant"].get("plant_under_freq_power_boost_enable") == 1 else "Disabled",
-        select_option_fn=lambda coordinator, _, option: coordinator.async_write_parameter(
-            "plant", None, "plant_under_freq_power_boost_enable", 1 if option == "Enabled" else 0
-        ),
+        current_option_fn=_option_getter("plant_under_freq_power_boost_enable", {1: "Enabled"}, "Disabled"),
+        select_option_fn=_plant_option_setter("plant_under_freq_power_boost_enable", {"Enabled": 1}, 0),
         entity_registry_enabled_default=False,
     ),
-]
+)
 
-INVERTER_SELECTS = [
+INVERTER_SELECTS = (
     # This register is deprecated in Modbus v. 2.7 and is now marked as reserved.
     # SigenergySelectEntityDescription(
     #     key="inverter_grid_code",
@@ -316,10 +339,10 @@ INVERTER_SELECTS = [
     #     entity_registry_enabled_default=False,
 
     # ),
-]
+)
 
-AC_CHARGER_SELECTS = []
-DC_CHARGER_SELECTS = []
+AC_CHARGER_SELECTS = ()
+DC_CHARGER_SELECTS = ()
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -331,32 +354,43 @@ async def async_setup_entry(
         hass.data[DOMAIN][config_entry.entry_id]["coordinator"])
     plant_name = config_entry.data[CONF_NAME]
     _LOGGER.debug("Starting to add %s", SigenergySelect)
-    # Add plant Selects
-    entities : list[SigenergySelect] = generate_sigen_entity(plant_name, None, None, coordinator,
-                                                             SigenergySelect,
-                                                             PLANT_SELECTS,
-                                                             DEVICE_TYPE_PLANT)
-
-    # Add inverter Selects
-    for device_name, device_conn in coordinator.hub.inverter_connections.items():
-        entities += generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
-                                          SigenergySelect,
-                                          INVERTER_SELECTS,
-                                          DEVICE_TYPE_INVERTER)
-
-    # Add AC charger Selects
-    for device_name, device_conn in coordinator.hub.ac_charger_connections.items():
-        entities += generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
-                                          SigenergySelect,
-                                          AC_CHARGER_SELECTS,
-                                          DEVICE_TYPE_AC_CHARGER)
-
-    async_add_entities(entities)
-    return
+    hub = coordinator.hub
+    async_add_entities(chain(
+        # Plant Selects
+        generate_sigen_entity(plant_name, None, None, coordinator,
+                              SigenergySelect,
+                              PLANT_SELECTS,
+                              DEVICE_TYPE_PLANT),
+        # Inverter Selects
+        chain.from_iterable(
+            generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
+                                  SigenergySelect,
+                                  INVERTER_SELECTS,
+                                  DEVICE_TYPE_INVERTER)
+            for device_name, device_conn in hub.inverter_connections.items()
+        ),
+        # AC charger Selects (none defined yet; skip walking the chargers)
+        chain.from_iterable(
+            generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
+                                  SigenergySelect,
+                                  AC_CHARGER_SELECTS,
+                                  DEVICE_TYPE_AC_CHARGER)
+            for device_name, device_conn in hub.ac_charger_connections.items()
+        ) if AC_CHARGER_SELECTS else (),
+    ))
 
 class SigenergySelect(SigenergyEntity, SelectEntity):
     """Representation of a Sigenergy select."""
 
+    # Slot-stored attributes, see SigenergyEntity.__slots__.
+    __slots__ = (
+        "_select_device_data",
+        "_current_option_fn",
+        "_select_option_fn",
+        "_option_cache",
+        "_available_fn",
+    )
+
     entity_description: SigenergySelectEntityDescription
     # Explicitly type coordinator here
     coordinator: SigenergyDataUpdateCoordinator
@@ -388,27 +422,41 @@ class SigenergySelect(SigenergyEntity, SelectEntity):
         # Select-specific initialization
         # Used by SelectEntity to determine valid choices.
         self._attr_options = description.options if description.options is not None else []
+        self._select_device_data = device_data_selector(device_type, device_name or "")
+        self._current_option_fn = description.current_option_fn
+        self._select_option_fn = description.select_option_fn
+        self._option_cache = CoordinatorDataCache(self._compute_current_option)
+        self._available_fn = (
+            None if description.available_fn is always_available else description.available_fn
+        )
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         if not super().available:
             return False
+        if self._available_fn is None:
+            return True
 
-        # Use device_name as the primary identifier passed to the lambda/function
-        identifier = self._device_name
-        return self.entity_description.available_fn(self.coordinator.data, identifier)
+        # Use device_name as the primary identifier passed to the function
+        return self._available_fn(self.coordinator.data, self._device_name)
 
     @property
     def current_option(self) -> str | None:
         """Return the selected entity option."""
-        if self.coordinator.data is None:
+        return self._option_cache.get(self.coordinator.data)
+
+    def _compute_current_option(self, data: Optional[Dict[str, Any]]) -> str | None:
+        """Compute the selected option from coordinator data."""
+        if data is None:
             return None
 
         # Use device_name as the primary identifier passed to the lambda/function
         identifier = self._device_name
         try:
-            option = self.entity_description.current_option_fn(self.coordinator.data, identifier)
+            option = self._current_option_fn(
+                self._select_device_data(data), identifier
+            )
             return option if option is not None else None
         except Exception as e:
             _LOGGER.error("Error getting current_option for %s (identifier: %s): %s",
@@ -423,7 +471,7 @@ class SigenergySelect(SigenergyEntity, SelectEntity):
         # Use device_name as the primary identifier passed to the lambda/function
         identifier = self._device_name
         # Exceptions are handled and logged in coordinator.async_write_parameter
-        await self.entity_description.select_option_fn(self.coordinator, identifier, option)
+        await self._select_option_fn(self.coordinator, identifier, option)
 
     def select_option(self, option: str) -> None:
         """Change the selected option."""
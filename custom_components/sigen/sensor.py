@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 import logging
-from datetime import date, timedelta
-from typing import Any, Optional, cast
+from datetime import date, datetime, timedelta
+from typing import Any, Mapping, Optional, cast
 from decimal import Decimal, InvalidOperation
+from types import MappingProxyType
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -20,7 +21,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .modbusregisterdefinitions import (
@@ -37,7 +38,15 @@ from .calculated_sensor import (
 )
 from .static_sensor import StaticSensors as SS
 from .static_sensor import COORDINATOR_DIAGNOSTIC_SENSORS # Import the new descriptions
-from .common import generate_sigen_entity, generate_device_id, SigenergySensorEntityDescription
+from .common import (
+    generate_sigen_entity,
+    generate_device_id,
+    generate_device_info,
+    device_data_selector,
+    CoordinatorDataCache,
+    EMPTY_DATA,
+    SigenergySensorEntityDescription,
+)
 from .const import (
     DOMAIN,
     DEVICE_TYPE_PLANT,
@@ -66,6 +75,49 @@ _PROTECTED_DAILY_ENERGY_KEYS = frozenset({
 # Legitimate midnight resets are allowed within ±20 minutes of 00:00.
 _DAILY_RESET_WINDOW = timedelta(minutes=20)
 
+# Alarm sensor keys mapped to the ALARM_CODES table used to decode their bits.
+# The key tables are only read when a sensor is constructed; keep them read-only.
+_KEY_ALARM_CODES: Mapping[str, str] = MappingProxyType({
+    # PCS alarms
+    "plant_general_alarm1": "PCS_ALARM_CODES",
+    "inverter_alarm1": "PCS_ALARM_CODES",
+    "plant_general_alarm2": "PCS_ALARM_CODES2",
+    "inverter_alarm2": "PCS_ALARM_CODES2",
+    # ESS alarms
+    "plant_general_alarm3": "ESS_ALARM_CODES",
+    "inverter_alarm3": "ESS_ALARM_CODES",
+    "inverter_ess_alarm": "ESS_ALARM_CODES",
+    # Gateway alarms
+    "plant_general_alarm4": "GATEWAY_ALARM_CODES",
+    "inverter_alarm4": "GATEWAY_ALARM_CODES",
+    "inverter_gateway_alarm": "GATEWAY_ALARM_CODES",
+    # DC Charger alarms
+    "plant_general_alarm5": "DC_CHARGER_ALARM_CODES",
+    "inverter_alarm5": "DC_CHARGER_ALARM_CODES",
+    "inverter_dc_charger_alarm": "DC_CHARGER_ALARM_CODES",
+    # Modbus v2.8 - plant alarms
+    "plant_general_alarm6": "PLANT_ALARM_CODES6",
+    "plant_general_alarm7": "PLANT_ALARM_CODES7",
+    # AC Charger alarms
+    "ac_charger_alarm1": "AC_CHARGER_ALARM_CODES1",
+    "ac_charger_alarm2": "AC_CHARGER_ALARM_CODES2",
+    "ac_charger_alarm3": "AC_CHARGER_ALARM_CODES3",
+})
+
+_RUNNING_STATE_NAMES: dict[int, str] = {
+    s.value: s.name.replace("_", " ").title() for s in RunningState
+}
+
+# Enum sensor keys mapped to the display text for each raw register value.
+_KEY_ENUM_MAPS: Mapping[str, dict[int, str]] = MappingProxyType({
+    "plant_on_off_grid_status": {0: "On Grid", 1: "Off Grid (Auto)", 2: "Off Grid (Manual)"},
+    "plant_running_state": _RUNNING_STATE_NAMES,
+    "inverter_running_state": _RUNNING_STATE_NAMES,
+    "ac_charger_system_state": {0: "Initializing", 1: "Not Connected", 2: "Reserving", 3: "Preparing", 4: "EV Ready", 5: "Charging", 6: "Fault", 7: "Error"},
+    "dc_charger_running_state": {s.value: s.name.replace("_", " ").title() for s in DCChargerRunningState},
+    "inverter_output_type": {0: "L/N", 1: "L1/L2/L3", 2: "L1/L2/L3/N", 3: "L1/L2/N"},
+    "plant_grid_sensor_status": {0: "Offline", 1: "Online"},
+})
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -77,11 +129,24 @@ async def async_setup_entry(
         config_entry.entry_id
     ]["coordinator"]
     plant_name = config_entry.data[CONF_NAME]
+    hub = coordinator.hub
+    entry_id = hub.config_entry.entry_id
     entities_to_add = []
+    # The plant and each inverter get sensors from several description tables;
+    # build their DeviceInfo once and share it across those calls.
+    device_infos: dict[tuple[str, str], DeviceInfo] = {}
 
     # Helper to add entities to the list
     def add_entities_for_device(device_name, device_conn,
                                 entity_descriptions, entity_class, device_type, **kwargs):
+        if kwargs.get("device_info") is None and kwargs.get("pv_string_idx") is None:
+            info_key = (device_type, device_name or plant_name)
+            device_info = device_infos.get(info_key)
+            if device_info is None:
+                device_info = device_infos[info_key] = generate_device_info(
+                    device_type, info_key[1], coordinator
+                )
+            kwargs["device_info"] = device_info
         entities_to_add.extend(
             generate_sigen_entity(
                 plant_name,
@@ -105,29 +170,32 @@ async def async_setup_entry(
     add_entities_for_device(None, None, SCS.PLANT_LIFETIME_DAILY_SENSORS, SigenergyLifetimeDailySensor, DEVICE_TYPE_PLANT, hass=hass)
     
     add_entities_for_device(None, None, SCS.PLANT_INTEGRATION_SENSORS, SigenergyIntegrationSensor, DEVICE_TYPE_PLANT, hass=hass)
-    add_entities_for_device(None, None, list(COORDINATOR_DIAGNOSTIC_SENSORS), CoordinatorDiagnosticSensor, DEVICE_TYPE_PLANT)
+    add_entities_for_device(None, None, COORDINATOR_DIAGNOSTIC_SENSORS, CoordinatorDiagnosticSensor, DEVICE_TYPE_PLANT)
 
     # Inverter and related sensors
-    for device_name, device_conn in coordinator.hub.inverter_connections.items():
+    for device_name, device_conn in hub.inverter_connections.items():
         add_entities_for_device(device_name, device_conn, SS.INVERTER_SENSORS, SigenergySensor, DEVICE_TYPE_INVERTER)
         add_entities_for_device(device_name, device_conn, SCS.INVERTER_SENSORS, SigenergySensor, DEVICE_TYPE_INVERTER)
         add_entities_for_device(device_name, device_conn, SCS.INVERTER_INTEGRATION_SENSORS, SigenergyIntegrationSensor, DEVICE_TYPE_INVERTER, hass=hass)
 
+        # Shared by the PV string and DC charger sub-devices of this inverter
+        parent_inverter_id = f"{entry_id}_{generate_device_id(device_name)}"
+        parent_inverter_identifier = (DOMAIN, parent_inverter_id)
+
         # PV Strings
-        inverter_data = (coordinator.data or {}).get("inverters", {}).get(device_name, {})
+        inverter_data = (coordinator.data or EMPTY_DATA).get("inverters", EMPTY_DATA).get(device_name, EMPTY_DATA)
         pv_string_count = inverter_data.get("inverter_pv_string_count", 0)
         if isinstance(pv_string_count, (int, float)) and pv_string_count > 0:
             for pv_idx in range(1, int(pv_string_count) + 1):
                 try:
                     pv_string_name = f"{device_name} PV{pv_idx}"
-                    parent_inverter_id = f"{coordinator.hub.config_entry.entry_id}_{generate_device_id(device_name)}"
                     pv_string_id = f"{parent_inverter_id}_pv{pv_idx}"
                     pv_device_info = DeviceInfo(
                         identifiers={(DOMAIN, pv_string_id)},
                         name=pv_string_name,
                         manufacturer="Sigenergy",
                         model="PV String",
-                        via_device=(DOMAIN, parent_inverter_id),
+                        via_device=parent_inverter_identifier,
                     )
                     add_entities_for_device(device_name, device_conn, SS.PV_STRING_SENSORS, PVStringSensor, DEVICE_TYPE_INVERTER, hass=hass, device_info=pv_device_info, pv_string_idx=pv_idx)
                     add_entities_for_device(device_name, device_conn, SCS.PV_STRING_SENSORS, PVStringSensor, DEVICE_TYPE_INVERTER, hass=hass, device_info=pv_device_info, pv_string_idx=pv_idx)
@@ -141,26 +209,25 @@ async def async_setup_entry(
                 dc_name = f"{device_name} DC Charger"
             else:
                 dc_name = device_name
-            parent_inverter_id = f"{coordinator.hub.config_entry.entry_id}_{generate_device_id(device_name)}"
             dc_id = f"{parent_inverter_id}_dc_charger"
             dc_device_info = DeviceInfo(
                 identifiers={(DOMAIN, dc_id)},
                 name=dc_name,
                 manufacturer="Sigenergy",
                 model="DC Charger",
-                via_device=(DOMAIN, parent_inverter_id),
+                via_device=parent_inverter_identifier,
             )
             add_entities_for_device(device_name, device_conn, SS.DC_CHARGER_SENSORS, SigenergySensor, DEVICE_TYPE_DC_CHARGER, device_info=dc_device_info)
 
-    # AC Charger Sensors
-    for ac_charger_name, ac_details in coordinator.hub.ac_charger_connections.items():
+    # AC Charger Sensors; the combined description tuple is shared by all chargers
+    ac_charger_sensors = SS.AC_CHARGER_SENSORS + SCS.AC_CHARGER_SENSORS
+    for ac_charger_name, ac_details in hub.ac_charger_connections.items():
         slave_id = ac_details.get(CONF_SLAVE_ID)
         if slave_id is None:
             _LOGGER.warning("Missing slave ID for AC charger '%s', skipping.", ac_charger_name)
             continue
-        
-        # Combine sensor descriptions for AC chargers
-        ac_charger_sensors = SS.AC_CHARGER_SENSORS + SCS.AC_CHARGER_SENSORS
+
+        ac_device_info = generate_device_info(DEVICE_TYPE_AC_CHARGER, ac_charger_name, coordinator)
         for description in ac_charger_sensors:
             sensor_name = f"{ac_charger_name} {description.name}"
             entities_to_add.append(
@@ -171,14 +238,17 @@ async def async_setup_entry(
                     device_type=DEVICE_TYPE_AC_CHARGER,
                     device_id=str(slave_id),
                     device_name=ac_charger_name,
+                    device_info=ac_device_info,
                 )
             )
 
     if entities_to_add:
         async_add_entities(entities_to_add)
         _LOGGER.debug("Added %d sensor entities", len(entities_to_add))
-        entity_unique_ids = [entity._attr_unique_id for entity in entities_to_add if hasattr(entity, '_attr_unique_id')]
-        _LOGGER.debug("Added sensor entity unique IDs: %s", ", ".join(entity_unique_ids))
+        # Only walk every entity to list its unique ID when debug logging is on
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            entity_unique_ids = [entity._attr_unique_id for entity in entities_to_add if hasattr(entity, '_attr_unique_id')]
+            _LOGGER.debug("Added sensor entity unique IDs: %s", ", ".join(entity_unique_ids))
         
         # Mark sensors as initialized so calculated sensors can start executing
         coordinator.mark_sensors_initialized()
@@ -189,6 +259,24 @@ async def async_setup_entry(
 class SigenergySensor(SigenergyEntity, SensorEntity):
     """Representation of a Sigenergy sensor."""
 
+    # Slot-stored attributes, see SigenergyEntity.__slots__.
+    __slots__ = (
+        "_round_digits",
+        "_missing_value",
+        "_value_fn",
+        "_value_fn_params",
+        "_select_device_data",
+        "_data_key",
+        "_is_timestamp",
+        "_alarm_codes",
+        "_enum_map",
+        "_last_valid_daily_energy_value",
+        "_last_valid_daily_energy_date",
+        "_timestamp_cache_key",
+        "_timestamp_cache_value",
+        "_value_cache",
+    )
+
     entity_description: SigenergySensorEntityDescription
 
     def __init__(
@@ -213,13 +301,30 @@ class SigenergySensor(SigenergyEntity, SensorEntity):
             device_info=device_info,
             pv_string_idx=pv_string_idx,
         )
-        self._round_digits = (
-            description.round_digits
-            if isinstance(description, SigenergySensorEntityDescription)
-            else None
-        )
+        self._round_digits = getattr(description, "round_digits", None)
+        # Sensors with a state class report no value as None, others as STATE_UNKNOWN
+        self._missing_value = None if description.state_class else STATE_UNKNOWN
+        self._value_fn = getattr(description, "value_fn", None)
+        # Built once and shared by every value_fn call; value_fn must not mutate it.
+        self._value_fn_params = {
+            **(getattr(description, "extra_params", None) or {}),
+            "device_name": device_name,
+        }
+        if pv_string_idx is not None:
+            self._value_fn_params["pv_idx"] = pv_string_idx
+        self._select_device_data = device_data_selector(device_type, device_name)
+        self._data_key = description.key
+        # Raw value handling depends only on the description; resolve it once
+        self._is_timestamp = description.device_class == SensorDeviceClass.TIMESTAMP
+        alarm_codes_key = _KEY_ALARM_CODES.get(description.key)
+        self._alarm_codes = ALARM_CODES[alarm_codes_key] if alarm_codes_key is not None else None
+        self._enum_map = _KEY_ENUM_MAPS.get(description.key)
         self._last_valid_daily_energy_value: Decimal | None = None
         self._last_valid_daily_energy_date: date | None = None
+        # Last (epoch, timezone offset) converted for timestamp sensors and its result
+        self._timestamp_cache_key: tuple[Any, Any] | None = None
+        self._timestamp_cache_value: datetime | None = None
+        self._value_cache = CoordinatorDataCache(self._compute_native_value)
 
     def _is_near_daily_reset(self) -> bool:
         """Return True if within ±20 minutes of midnight (legitimate daily reset window).
@@ -243,10 +348,15 @@ class SigenergySensor(SigenergyEntity, SensorEntity):
             return value
         if value is None:
             return value
-        try:
-            decimal_value = Decimal(str(value))
-        except (ValueError, TypeError, InvalidOperation):
-            return value
+        # Rounded values already arrive as Decimal and integers convert exactly;
+        # only other types need the string round-trip.
+        if isinstance(value, (Decimal, int)):
+            decimal_value = Decimal(value)
+        else:
+            try:
+                decimal_value = Decimal(str(value))
+            except (ValueError, TypeError, InvalidOperation):
+                return value
         last = self._last_valid_daily_energy_value
         today = dt_util.now().date()
         last_date = self._last_valid_daily_energy_date
@@ -281,32 +391,24 @@ class SigenergySensor(SigenergyEntity, SensorEntity):
             
         return ", ".join(active_alarms)
 
-    def _get_raw_value(self) -> Any:
-        """Retrieve the raw value from coordinator data for this entity."""
-        data = self.coordinator.data or {}
-        if self._device_type == DEVICE_TYPE_PLANT:
-            return data.get("plant", {}).get(self.entity_description.key)
-        if self._device_type == DEVICE_TYPE_INVERTER:
-            return data.get("inverters", {}).get(self._device_name, {}).get(self.entity_description.key)
-        if self._device_type == DEVICE_TYPE_AC_CHARGER:
-            return data.get("ac_chargers", {}).get(self._device_name, {}).get(self.entity_description.key)
-        if self._device_type == DEVICE_TYPE_DC_CHARGER:
-            return data.get("dc_chargers", {}).get(self._device_name, {}).get(self.entity_description.key)
-        return None
-
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        raw_value = self._get_raw_value()
-        data = self.coordinator.data
+        return self._value_cache.get(self.coordinator.data)
+
+    def _compute_native_value(self, data: Optional[dict[str, Any]]) -> Any:
+        """Compute the state of the sensor from coordinator data."""
         if data is None:
             return None
+        # Select from the same data the cache is keyed on, so a read that
+        # lands before this entity's update callback never caches stale values
+        raw_value = self._select_device_data(data).get(self._data_key)
 
-        if hasattr(self.entity_description, "value_fn") and self.entity_description.value_fn:
+        fn = self._value_fn
+        if fn:
             try:
                 # Call transformation function, trying 3,2,1 args for compatibility
-                fn = self.entity_description.value_fn
-                extra_params = {**(getattr(self.entity_description, "extra_params", {}) or {}), "device_name": self._device_name}
+                extra_params = self._value_fn_params
                 transformed = None
                 for args in [(raw_value, data, extra_params), (raw_value, data), (raw_value,)]:
                     try:
@@ -324,57 +426,31 @@ class SigenergySensor(SigenergyEntity, SensorEntity):
                     _LOGGER.debug("Value function failed for %s because data is missing: %s", self.entity_id, ex)
                 else:
                     _LOGGER.error("Error in value_fn for %s: %s", self.entity_id, ex, exc_info=True)
-                return None if self.entity_description.state_class else STATE_UNKNOWN
+                return self._missing_value
 
         # No transformation function, handle raw_value
         if raw_value is None:
-            return None if self.entity_description.state_class else STATE_UNKNOWN
+            return self._missing_value
 
         # Handle special data types
-        if self.entity_description.device_class == SensorDeviceClass.TIMESTAMP:
-            return SC.epoch_to_datetime(raw_value, data) if raw_value else None
+        if self._is_timestamp:
+            if not raw_value:
+                return None
+            # The epoch rarely changes between polls; only convert when it or the timezone does
+            cache_key = (raw_value, data.get("plant", EMPTY_DATA).get("plant_system_timezone"))
+            if cache_key != self._timestamp_cache_key:
+                self._timestamp_cache_value = SC.epoch_to_datetime(raw_value, data)
+                self._timestamp_cache_key = cache_key
+            return self._timestamp_cache_value
 
         # Handle alarm codes
-        if "alarm" in self.entity_description.key.lower():
-            # Handle PCS alarms (plant_general_alarm1/2 and inverter_alarm1/2)
-            if self.entity_description.key in ["plant_general_alarm1", "inverter_alarm1"]:
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["PCS_ALARM_CODES"])
-            elif self.entity_description.key in ["plant_general_alarm2", "inverter_alarm2"]:
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["PCS_ALARM_CODES2"])
-            # Handle ESS alarms
-            elif self.entity_description.key in ["plant_general_alarm3", "inverter_alarm3", "inverter_ess_alarm"]:
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["ESS_ALARM_CODES"])
-            # Handle Gateway alarms
-            elif self.entity_description.key in ["plant_general_alarm4", "inverter_alarm4", "inverter_gateway_alarm"]:
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["GATEWAY_ALARM_CODES"])
-            # Handle DC Charger alarms
-            elif self.entity_description.key in ["plant_general_alarm5", "inverter_alarm5", "inverter_dc_charger_alarm"]:
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["DC_CHARGER_ALARM_CODES"])
-            # Modbus v2.8 - Handle new plant alarms
-            elif self.entity_description.key == "plant_general_alarm6":
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["PLANT_ALARM_CODES6"])
-            elif self.entity_description.key == "plant_general_alarm7":
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["PLANT_ALARM_CODES7"])
-            # Handle AC Charger alarms
-            elif self.entity_description.key == "ac_charger_alarm1":
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["AC_CHARGER_ALARM_CODES1"])
-            elif self.entity_description.key == "ac_charger_alarm2":
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["AC_CHARGER_ALARM_CODES2"])
-            elif self.entity_description.key == "ac_charger_alarm3":
-                return self._decode_alarm_bits(raw_value, ALARM_CODES["AC_CHARGER_ALARM_CODES3"])
+        if self._alarm_codes is not None:
+            return self._decode_alarm_bits(raw_value, self._alarm_codes)
 
         # Handle enums
-        enum_maps = {
-            "plant_on_off_grid_status": {0: "On Grid", 1: "Off Grid (Auto)", 2: "Off Grid (Manual)"},
-            "plant_running_state": {s.value: s.name.replace("_", " ").title() for s in RunningState},
-            "inverter_running_state": {s.value: s.name.replace("_", " ").title() for s in RunningState},
-            "ac_charger_system_state": {0: "Initializing", 1: "Not Connected", 2: "Reserving", 3: "Preparing", 4: "EV Ready", 5: "Charging", 6: "Fault", 7: "Error"},
-            "dc_charger_running_state": {s.value: s.name.replace("_", " ").title() for s in DCChargerRunningState},
-            "inverter_output_type":  {0: "L/N", 1: "L1/L2/L3", 2: "L1/L2/L3/N", 3: "L1/L2/N"},
-            "plant_grid_sensor_status": {0: "Offline", 1: "Online"},
-        }
-        if self.entity_description.key in enum_maps:
-            return enum_maps[self.entity_description.key].get(raw_value, f"Unknown: {raw_value}")
+        enum_map = self._enum_map
+        if enum_map is not None:
+            return enum_map.get(raw_value, f"Unknown: {raw_value}")
 
         if self._round_digits is not None:
             try:
@@ -409,13 +485,15 @@ class PVStringSensor(SigenergySensor):
             device_info=device_info,
             pv_string_idx=pv_string_idx,
         )
+        # PV string values are stored on the inverter under a per-string key
+        self._data_key = f"inverter_pv{pv_string_idx}_{description.key}"
 
     @property
     def available(self) -> bool:
         """Return if PV String entity is available based on parent inverter."""
         return (
             super().available and
-            self._device_name in (self.coordinator.data or {}).get("inverters", {})
+            self._device_name in (self.coordinator.data or EMPTY_DATA).get("inverters", EMPTY_DATA)
         )
 
     @property
@@ -424,21 +502,18 @@ class PVStringSensor(SigenergySensor):
         if not self.available or self.coordinator.data is None:
             return None
 
-        inverter_data = self.coordinator.data.get("inverters", {}).get(self._device_name, {})
-        
-        if hasattr(self.entity_description, "value_fn") and self.entity_description.value_fn:
+        if self._value_fn:
             try:
-                return self.entity_description.value_fn(
+                return self._value_fn(
                     None,
                     self.coordinator.data,
-                    getattr(self.entity_description, "extra_params", {}),
+                    self._value_fn_params,
                 )
             except Exception as ex:
                 _LOGGER.error("Error in PVStringSensor value_fn for %s: %s", self.entity_id, ex)
                 return None
         
-        data_key = f"inverter_pv{self._pv_string_idx}_{self.entity_description.key}"
-        value = inverter_data.get(data_key)
+        value = self._select_device_data(self.coordinator.data).get(self._data_key)
 
         if value is None:
             return None
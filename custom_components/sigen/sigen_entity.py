@@ -2,71 +2,68 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
 
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity  # pylint: disable=syntax-error
 
 from .const import (
-    DOMAIN,
     DEVICE_TYPE_PLANT,
     DEVICE_TYPE_INVERTER,
     DEVICE_TYPE_AC_CHARGER,
     DEVICE_TYPE_DC_CHARGER,
 )
 from .coordinator import SigenergyDataUpdateCoordinator
-from .common import generate_unique_entity_id, generate_device_id
+from .common import EMPTY_DATA, generate_unique_entity_id, generate_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+_KNOWN_DEVICE_TYPES = frozenset(
+    {DEVICE_TYPE_PLANT, DEVICE_TYPE_INVERTER, DEVICE_TYPE_AC_CHARGER, DEVICE_TYPE_DC_CHARGER}
+)
 
-def _generate_device_info(
-    device_type: str,
-    device_name: str,
-    coordinator: SigenergyDataUpdateCoordinator,
-) -> DeviceInfo:
-    """Generate device information for a Sigenergy entity."""
-    config_entry_id = coordinator.hub.config_entry.entry_id
-    plant_device_identifier = (DOMAIN, f"{config_entry_id}_plant")
-
-    if device_type == DEVICE_TYPE_PLANT:
-        return DeviceInfo(
-            identifiers={plant_device_identifier},
-            name=device_name,
-            manufacturer="Sigenergy",
-            model="Energy Storage System",
-        )
 
-    device_info_data = {
-        "identifiers": {(DOMAIN, f"{config_entry_id}_{generate_device_id(device_name)}")},
-        "name": device_name,
-        "manufacturer": "Sigenergy",
-        "via_device": plant_device_identifier,
-    }
-
-    if device_type == DEVICE_TYPE_INVERTER:
-        inverter_data = (coordinator.data or {}).get("inverters", {}).get(device_name, {})
-        device_info_data.update(
-            {
-                "model": inverter_data.get("inverter_model_type", "Sigen Inverter"),
-                "serial_number": inverter_data.get("inverter_serial_number"),
-                "sw_version": inverter_data.get("inverter_machine_firmware_version"),
-            }
-        )
-    elif device_type == DEVICE_TYPE_AC_CHARGER:
-        device_info_data["model"] = "AC Charger"
-    elif device_type == DEVICE_TYPE_DC_CHARGER:
-        device_info_data["model"] = "DC Charger"
-    else:
-        _LOGGER.warning("Unknown device type '%s' for device '%s'", device_type, device_name)
-        device_info_data["model"] = "Unknown Device"
+def _plant_available(data: Dict[str, Any], _: str) -> bool:
+    """Return True if plant data is present."""
+    return "plant" in data
+
+
+def _inverter_available(data: Dict[str, Any], inverter_name: str) -> bool:
+    """Return True if data for the given inverter is present."""
+    return inverter_name in data.get("inverters", EMPTY_DATA)
 
-    return DeviceInfo(**device_info_data)
+
+def _ac_charger_available(data: Dict[str, Any], ac_charger_name: str) -> bool:
+    """Return True if data for the given AC charger is present."""
+    return ac_charger_name in data.get("ac_chargers", EMPTY_DATA)
+
+
+# Availability check per device type, called with coordinator data and the name
+# of the device whose data must be present (the parent inverter for DC chargers).
+_AVAILABILITY_CHECKS: Dict[str, Callable[[Dict[str, Any], str], bool]] = {
+    DEVICE_TYPE_PLANT: _plant_available,
+    DEVICE_TYPE_INVERTER: _inverter_available,
+    DEVICE_TYPE_AC_CHARGER: _ac_charger_available,
+    DEVICE_TYPE_DC_CHARGER: _inverter_available,
+}
 
 
 class SigenergyEntity(CoordinatorEntity):
     """Base representation of a Sigenergy entity."""
 
+    # Only these attributes are slot-stored; HA's entity base classes define no
+    # __slots__, so instances still have a __dict__ and the saving is small.
+    __slots__ = (
+        "hub",
+        "_device_type",
+        "_device_id",
+        "_device_name",
+        "_pv_string_idx",
+        "_device_info_override",
+        "_availability_check",
+        "_availability_name",
+    )
+
     _attr_has_entity_name = True  # Use default HA entity naming
 
     def __init__(
@@ -81,6 +78,8 @@ class SigenergyEntity(CoordinatorEntity):
         pv_string_idx: Optional[int] = None,
     ) -> None:
         """Initialize the base entity."""
+        if device_type not in _KNOWN_DEVICE_TYPES:
+            raise ValueError(f"Unknown device type '{device_type}' for device '{device_name}'")
         super().__init__(coordinator)
         self.entity_description = description
         self.hub = coordinator.hub
@@ -91,6 +90,12 @@ class SigenergyEntity(CoordinatorEntity):
         self._device_name = device_name  # Store device name (e.g., "Inverter 1", "Plant", "AC Charger 1")
         self._pv_string_idx = pv_string_idx
         self._device_info_override = device_info
+        self._availability_check = _AVAILABILITY_CHECKS[device_type]
+        self._availability_name = (
+            device_name.replace(" DC Charger", "").strip()
+            if device_type == DEVICE_TYPE_DC_CHARGER
+            else device_name
+        )
 
         # Set unique ID
         self._attr_unique_id = generate_unique_entity_id(
@@ -101,7 +106,7 @@ class SigenergyEntity(CoordinatorEntity):
         if device_info:
             self._attr_device_info = device_info
         else:
-            self._attr_device_info = _generate_device_info(
+            self._attr_device_info = generate_device_info(
                 device_type, device_name, coordinator
             )
 
@@ -111,15 +116,4 @@ class SigenergyEntity(CoordinatorEntity):
         if not self.coordinator.last_update_success or self.coordinator.data is None:
             return False
 
-        data = self.coordinator.data
-        if self._device_type == DEVICE_TYPE_PLANT:
-            return "plant" in data
-        if self._device_type == DEVICE_TYPE_INVERTER:
-            return self._device_name in data.get("inverters", {})
-        if self._device_type == DEVICE_TYPE_AC_CHARGER:
-            return self._device_name in data.get("ac_chargers", {})
-        if self._device_type == DEVICE_TYPE_DC_CHARGER:
-            parent_inverter_name = self._device_name.replace(" DC Charger", "").strip()
-            return parent_inverter_name in data.get("inverters", {})
-
-        return True
\ No newline at end of file
+        return self._availability_check(self.coordinator.data, self._availability_name)
\ No newline at end of file
@@ -23,7 +23,7 @@ from .common import (SigenergySensorEntityDescription)
 
 class StaticSensors:
     # PV string sensor descriptions
-    PV_STRING_SENSORS = [
+    PV_STRING_SENSORS = (
         SigenergySensorEntityDescription(
             key="voltage",
             name="Voltage",
@@ -40,9 +40,9 @@ class StaticSensors:
             state_class=SensorStateClass.MEASUREMENT,
             suggested_display_precision=3,
         ),
-    ]
+    )
 
-    PLANT_SENSORS = [
+    PLANT_SENSORS = (
         SigenergySensorEntityDescription(
             key="plant_grid_sensor_status",
             name="Grid Sensor Status",
@@ -1098,9 +1098,9 @@ class StaticSensors:
             suggested_unit_of_measurement=UnitOfEnergy.MEGA_WATT_HOUR,
             entity_registry_enabled_default=False,
         )
-    ]
+    )
 
-    INVERTER_SENSORS = [
+    INVERTER_SENSORS = (
         # Power ratings
         SigenergySensorEntityDescription(
             key="inverter_model_type",
@@ -1678,8 +1678,8 @@ class StaticSensors:
         #     state_class=SensorStateClass.TOTAL_INCREASING,
         # ),
 
-    ]
-    AC_CHARGER_SENSORS = [
+    )
+    AC_CHARGER_SENSORS = (
         SigenergySensorEntityDescription(
             key="ac_charger_system_state",
             name="System State",
@@ -1754,9 +1754,9 @@ class StaticSensors:
             icon="mdi:alert",
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
-    ]
+    )
 
-    DC_CHARGER_SENSORS = [
+    DC_CHARGER_SENSORS = (
         SigenergySensorEntityDescription(
             key="dc_charger_vehicle_battery_voltage",
             name="Vehicle Battery Voltage",
@@ -1876,7 +1876,7 @@ class StaticSensors:
             icon="mdi:ev-plug-ccs2",
             suggested_display_precision=3,
         ),
-    ]
+    )
 
 
 COORDINATOR_DIAGNOSTIC_SENSORS: tuple[SigenergySensorEntityDescription, ...] = (
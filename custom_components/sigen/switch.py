@@ -3,24 +3,31 @@ from __future__ import annotations
 import logging
 import asyncio
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any, Coroutine, Callable, Dict, Optional
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry  #pylint: disable=no-name-in-module, syntax-error
 from homeassistant.const import CONF_NAME, EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.exceptions import HomeAssistantError
 
-from .common import generate_sigen_entity, generate_device_id
+from .common import (
+    EMPTY_DATA,
+    CoordinatorDataCache,
+    always_available,
+    device_data_selector,
+    generate_sigen_entity,
+    generate_device_id,
+)
 from .const import (
     DEVICE_TYPE_AC_CHARGER,
     DEVICE_TYPE_DC_CHARGER,
     DEVICE_TYPE_INVERTER,
     DEVICE_TYPE_PLANT,
     DOMAIN,
-    CONF_INVERTER_HAS_DCCHARGER,
 )
 from .coordinator import SigenergyDataUpdateCoordinator # Import coordinator
 from .sigen_entity import SigenergyEntity # Import the new base class
@@ -28,43 +35,87 @@ from .sigen_entity import SigenergyEntity # Import the new base class
 _LOGGER = logging.getLogger(__name__)
 
 
+def _never_on(device_data: Dict[str, Any], _: Optional[Any]) -> bool:
+    """Default is_on_fn."""
+    return False
+
+
+async def _no_write(coordinator: SigenergyDataUpdateCoordinator, _: Optional[Any]) -> None:
+    """Default turn_on_fn/turn_off_fn; writes nothing."""
+
+
+def _register_equals(key: str, on_value: int) -> Callable[[Dict[str, Any], Optional[Any]], bool]:
+    """Return an is_on_fn checking a device register against its on value."""
+    def is_on(device_data: Dict[str, Any], _: Optional[Any]) -> bool:
+        return device_data.get(key) == on_value
+    return is_on
+
+
+def _register_in(key: str, on_values: frozenset[int]) -> Callable[[Dict[str, Any], Optional[Any]], bool]:
+    """Return an is_on_fn checking a device register against a set of on values."""
+    def is_on(device_data: Dict[str, Any], _: Optional[Any]) -> bool:
+        return device_data.get(key) in on_values
+    return is_on
+
+
+def _register_nonzero(key: str) -> Callable[[Dict[str, Any], Optional[Any]], bool]:
+    """Return an is_on_fn that is on while a device register is neither missing nor zero."""
+    def is_on(device_data: Dict[str, Any], _: Optional[Any]) -> bool:
+        return bool(device_data.get(key))
+    return is_on
+
+
+def _parameter_writer(
+    device_type: str, key: str, value: int
+) -> Callable[[SigenergyDataUpdateCoordinator, Optional[Any]], Coroutine[Any, Any, None]]:
+    """Return a turn_on_fn/turn_off_fn writing a fixed value to a device register."""
+    # The plant is addressed without an identifier
+    is_plant = device_type == DEVICE_TYPE_PLANT
+
+    def write(
+        coordinator: SigenergyDataUpdateCoordinator, identifier: Optional[Any]
+    ) -> Coroutine[Any, Any, None]:
+        return coordinator.async_write_parameter(
+            device_type, None if is_plant else identifier, key, value
+        )
+    return write
+
+
 @dataclass(frozen=True)
 class SigenergySwitchEntityDescription(SwitchEntityDescription):
     """Class describing Sigenergy switch entities."""
 
-    # Provide default lambdas instead of None to satisfy type checker
-    # The second argument 'identifier' will be device_name for inverters, device_id otherwise
-    is_on_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = lambda data, identifier: False # Remains synchronous
-    # Make turn_on/off functions async and update type hint
-    # Make turn_on/off functions async and update type hint to accept coordinator
-    turn_on_fn: Callable[[SigenergyDataUpdateCoordinator, Optional[Any]], Coroutine[Any, Any, None]] = lambda coordinator, identifier: asyncio.sleep(0) # Placeholder async lambda
-    turn_off_fn: Callable[[SigenergyDataUpdateCoordinator, Optional[Any]], Coroutine[Any, Any, None]] = lambda coordinator, identifier: asyncio.sleep(0) # Placeholder async lambda
-    available_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = lambda data, _: True
+    # is_on_fn receives the entity's device data section (e.g. data["plant"]) and the
+    # device name; turn_on_fn/turn_off_fn are async and receive the coordinator to write through.
+    is_on_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = _never_on
+    turn_on_fn: Callable[[SigenergyDataUpdateCoordinator, Optional[Any]], Coroutine[Any, Any, None]] = _no_write
+    turn_off_fn: Callable[[SigenergyDataUpdateCoordinator, Optional[Any]], Coroutine[Any, Any, None]] = _no_write
+    available_fn: Callable[[Dict[str, Any], Optional[Any]], bool] = always_available
     entity_registry_enabled_default: bool = True
 
 
 def _deprecated_ac_charger_switch_available(data: Dict[str, Any], identifier: Optional[Any]) -> bool:
     """Preserve legacy switch availability when charger state is missing."""
-    return data.get("ac_chargers", {}).get(identifier, {}).get("ac_charger_system_state") not in (0, 1)
+    return data.get("ac_chargers", EMPTY_DATA).get(identifier, EMPTY_DATA).get("ac_charger_system_state") not in (0, 1)
 
 
-PLANT_SWITCHES: list[SigenergySwitchEntityDescription] = [
+PLANT_SWITCHES: tuple[SigenergySwitchEntityDescription, ...] = (
     SigenergySwitchEntityDescription(
         key="plant_start_stop",
         name="Plant Power",
         icon="mdi:power",
-        is_on_fn=lambda data, _: data["plant"].get("plant_running_state") == 1, # Sync
-        turn_on_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_start_stop", 1),
-        turn_off_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_start_stop", 0),
+        is_on_fn=_register_equals("plant_running_state", 1),
+        turn_on_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_start_stop", 1),
+        turn_off_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_start_stop", 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySwitchEntityDescription(
         key="plant_remote_ems_enable",
         name="Remote EMS (Controlled by Home Assistant)",
         icon="mdi:home-assistant",
-        is_on_fn=lambda data, _: data.get("plant", {}).get("plant_remote_ems_enable") == 1,
-        turn_on_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_remote_ems_enable", 1),
-        turn_off_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_remote_ems_enable", 0),
+        is_on_fn=_register_equals("plant_remote_ems_enable", 1),
+        turn_on_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_remote_ems_enable", 1),
+        turn_off_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_remote_ems_enable", 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySwitchEntityDescription(
@@ -72,70 +123,70 @@ PLANT_SWITCHES: list[SigenergySwitchEntityDescription] = [
         name="Independent Phase Power Control",
         icon="mdi:tune",
         entity_category=EntityCategory.CONFIG,
-        is_on_fn=lambda data, _: data.get("plant", {}).get("plant_independent_phase_power_control_enable") == 1,
-        turn_on_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_independent_phase_power_control_enable", 1),
-        turn_off_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_independent_phase_power_control_enable", 0),
+        is_on_fn=_register_equals("plant_independent_phase_power_control_enable", 1),
+        turn_on_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_independent_phase_power_control_enable", 1),
+        turn_off_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_independent_phase_power_control_enable", 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySwitchEntityDescription(
         key="plant_ess_preheating_enable",
         name="ESS Preheating Enable",
         icon="mdi:radiator",
-        is_on_fn=lambda data, _: data.get("plant", {}).get("plant_ess_preheating_enable") == 1,
-        turn_on_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_ess_preheating_enable", 1),
-        turn_off_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_ess_preheating_enable", 0),
+        is_on_fn=_register_equals("plant_ess_preheating_enable", 1),
+        turn_on_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_ess_preheating_enable", 1),
+        turn_off_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_ess_preheating_enable", 0),
         entity_registry_enabled_default=False,
     ),
     SigenergySwitchEntityDescription(
         key="plant_ess_preheating_advance_enable",
         name="ESS Preheating Advance Enable",
         icon="mdi:clock-fast",
-        is_on_fn=lambda data, _: data.get("plant", {}).get("plant_ess_preheating_advance_enable") == 1,
-        turn_on_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_ess_preheating_advance_enable", 1),
-        turn_off_fn=lambda coordinator, _: coordinator.async_write_parameter("plant", None, "plant_ess_preheating_advance_enable", 0),
+        is_on_fn=_register_equals("plant_ess_preheating_advance_enable", 1),
+        turn_on_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_ess_preheating_advance_enable", 1),
+        turn_off_fn=_parameter_writer(DEVICE_TYPE_PLANT, "plant_ess_preheating_advance_enable", 0),
         entity_registry_enabled_default=False,
     ),
-]
+)
 
-INVERTER_SWITCHES: list[SigenergySwitchEntityDescription] = [
+INVERTER_SWITCHES: tuple[SigenergySwitchEntityDescription, ...] = (
     SigenergySwitchEntityDescription(
         key="inverter_start_stop",
         name="Inverter Power",
         icon="mdi:power",
-        # Use device_name (inverter_name) instead of device_id (now passed as the second arg 'identifier')
-        is_on_fn=lambda data, identifier: data.get("inverters", {}).get(identifier, {}).get("inverter_running_state") == 1,
-        turn_on_fn=lambda coordinator, identifier: coordinator.async_write_parameter("inverter", identifier, "inverter_start_stop", 1),
-        turn_off_fn=lambda coordinator, identifier: coordinator.async_write_parameter("inverter", identifier, "inverter_start_stop", 0),
+        is_on_fn=_register_equals("inverter_running_state", 1),
+        # Written to the inverter named by the identifier (device_name)
+        turn_on_fn=_parameter_writer(DEVICE_TYPE_INVERTER, "inverter_start_stop", 1),
+        turn_off_fn=_parameter_writer(DEVICE_TYPE_INVERTER, "inverter_start_stop", 0),
         entity_registry_enabled_default=False,
     ),
     # Register 41500 (inverter_remote_ems_dispatch_enable) removed in Modbus v2.8
-]
-AC_CHARGER_SWITCHES: list[SigenergySwitchEntityDescription] = [
+)
+AC_CHARGER_SWITCHES: tuple[SigenergySwitchEntityDescription, ...] = (
     SigenergySwitchEntityDescription(
         key="ac_charger_start_stop",
         name="AC Charger Power (Deprecated)",
         icon="mdi:ev-station",
-        # identifier here will be ac_charger_name
-        is_on_fn=lambda data, identifier: data.get("ac_chargers", {}).get(identifier, {}).get("ac_charger_system_state") in (2,3,4,5),
+        # On while reserving, preparing, EV ready or charging
+        is_on_fn=_register_in("ac_charger_system_state", frozenset((2, 3, 4, 5))),
         # Check if EV is connected (State != 0 (Init) and != 1 (A1_A2))
         available_fn=_deprecated_ac_charger_switch_available,
-        turn_on_fn=lambda coordinator, identifier: coordinator.async_write_parameter("ac_charger", identifier, "ac_charger_start_stop", 0),
-        turn_off_fn=lambda coordinator, identifier: coordinator.async_write_parameter("ac_charger", identifier, "ac_charger_start_stop", 1),
+        turn_on_fn=_parameter_writer(DEVICE_TYPE_AC_CHARGER, "ac_charger_start_stop", 0),
+        turn_off_fn=_parameter_writer(DEVICE_TYPE_AC_CHARGER, "ac_charger_start_stop", 1),
         entity_registry_enabled_default=False,
     ),
-]
+)
 
-DC_CHARGER_SWITCHES: list[SigenergySwitchEntityDescription] = [
+DC_CHARGER_SWITCHES: tuple[SigenergySwitchEntityDescription, ...] = (
     SigenergySwitchEntityDescription(
         key="dc_charging",
         name="DC Charging",
         icon="mdi:ev-station",
-        # CHANGED: is_on_fn now checks != 0 to reflect both charging (positive) and discharging (negative) states
-        is_on_fn=lambda data, identifier: (data.get("dc_chargers", {}).get(identifier, {}).get("dc_charger_output_power", 0) or 0) != 0,
-        turn_on_fn=lambda coordinator, identifier: coordinator.async_write_parameter("dc_charger", identifier, "dc_charger_start_stop", 0),
-        turn_off_fn=lambda coordinator, identifier: coordinator.async_write_parameter("dc_charger", identifier, "dc_charger_start_stop", 1),
+        # On for both charging (positive) and discharging (negative) output power
+        is_on_fn=_register_nonzero("dc_charger_output_power"),
+        turn_on_fn=_parameter_writer(DEVICE_TYPE_DC_CHARGER, "dc_charger_start_stop", 0),
+        turn_off_fn=_parameter_writer(DEVICE_TYPE_DC_CHARGER, "dc_charger_start_stop", 1),
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -146,59 +197,75 @@ async def async_setup_entry(
     """Set up the Sigenergy switch platform."""
     coordinator: SigenergyDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     plant_name = config_entry.data[CONF_NAME]
-    entities_to_add = []
-
-    # Helper to add entities to the list
-    def add_entities_for_device(device_name, device_conn,
-                                entity_descriptions, device_type, **kwargs):
-        entities_to_add.extend(
-            generate_sigen_entity(
-                plant_name,
-                device_name,
-                device_conn,
-                coordinator,
-                SigenergySwitch,
-                entity_descriptions,
-                device_type,
-                **kwargs,
-            )
+
+    hub = coordinator.hub
+
+    def _dc_charger_entities(device_name: str, device_conn: dict) -> list[SigenergySwitch]:
+        """Create the DC charger switches hosted by an inverter."""
+        dc_name = f"{device_name} DC Charger"
+        parent_inverter_id = f"{hub.config_entry.entry_id}_{generate_device_id(device_name)}"
+        dc_id = f"{parent_inverter_id}_dc_charger"
+        dc_device_info = DeviceInfo(
+            identifiers={(DOMAIN, dc_id)},
+            name=dc_name,
+            manufacturer="Sigenergy",
+            model="DC Charger",
+            via_device=(DOMAIN, parent_inverter_id),
+        )
+        return generate_sigen_entity(
+            plant_name,
+            device_name,
+            device_conn,
+            coordinator,
+            SigenergySwitch,
+            DC_CHARGER_SWITCHES,
+            DEVICE_TYPE_DC_CHARGER,
+            device_info=dc_device_info,
         )
 
-    # Plant Switches
-    add_entities_for_device(None, None, PLANT_SWITCHES, DEVICE_TYPE_PLANT)
-
-    # Inverter and related switches
-    for device_name, device_conn in coordinator.hub.inverter_connections.items():
-        add_entities_for_device(device_name, device_conn, INVERTER_SWITCHES, DEVICE_TYPE_INVERTER)
-
-        # DC Charger
-        if device_conn.get(CONF_INVERTER_HAS_DCCHARGER, False):
-            dc_name = f"{device_name} DC Charger"
-            parent_inverter_id = f"{coordinator.hub.config_entry.entry_id}_{generate_device_id(device_name)}"
-            dc_id = f"{parent_inverter_id}_dc_charger"
-            dc_device_info = DeviceInfo(
-                identifiers={(DOMAIN, dc_id)},
-                name=dc_name,
-                manufacturer="Sigenergy",
-                model="DC Charger",
-                via_device=(DOMAIN, parent_inverter_id),
-            )
-            add_entities_for_device(device_name, device_conn, DC_CHARGER_SWITCHES, DEVICE_TYPE_DC_CHARGER, device_info=dc_device_info)
-
-    # AC Charger Switches
-    for device_name, device_conn in coordinator.hub.ac_charger_connections.items():
-        add_entities_for_device(device_name, device_conn, AC_CHARGER_SWITCHES, DEVICE_TYPE_AC_CHARGER)
-
-    if entities_to_add:
-        async_add_entities(entities_to_add)
-        _LOGGER.debug("Added %d switch entities", len(entities_to_add))
-    else:
-        _LOGGER.debug("No switch entities to add.")
+    async_add_entities(chain(
+        # Plant switches
+        generate_sigen_entity(plant_name, None, None, coordinator,
+                              SigenergySwitch,
+                              PLANT_SWITCHES,
+                              DEVICE_TYPE_PLANT),
+        # Inverter switches
+        chain.from_iterable(
+            generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
+                                  SigenergySwitch,
+                                  INVERTER_SWITCHES,
+                                  DEVICE_TYPE_INVERTER)
+            for device_name, device_conn in hub.inverter_connections.items()
+        ),
+        # DC charger switches
+        chain.from_iterable(
+            _dc_charger_entities(device_name, device_conn)
+            for device_name, device_conn in hub.dc_charger_connections.items()
+        ),
+        # AC charger switches
+        chain.from_iterable(
+            generate_sigen_entity(plant_name, device_name, device_conn, coordinator,
+                                  SigenergySwitch,
+                                  AC_CHARGER_SWITCHES,
+                                  DEVICE_TYPE_AC_CHARGER)
+            for device_name, device_conn in hub.ac_charger_connections.items()
+        ),
+    ))
 
 
 class SigenergySwitch(SigenergyEntity, SwitchEntity):
     """Representation of a Sigenergy switch."""
 
+    # Slot-stored attributes, see SigenergyEntity.__slots__.
+    __slots__ = (
+        "_select_device_data",
+        "_is_on_cache",
+        "_available_fn",
+        "_write_lock",
+        "_queued_state",
+        "_queued_write",
+    )
+
     entity_description: SigenergySwitchEntityDescription
     # Explicitly type coordinator here to override the generic base class type
     coordinator: SigenergyDataUpdateCoordinator
@@ -225,35 +292,85 @@ class SigenergySwitch(SigenergyEntity, SwitchEntity):
             device_info=device_info,
             pv_string_idx=pv_string_idx,
         )
+        self._select_device_data = device_data_selector(device_type, device_name)
+        self._is_on_cache = CoordinatorDataCache(self._compute_is_on)
+        self._available_fn = (
+            None if description.available_fn is always_available else description.available_fn
+        )
+        # Held while a write is in flight. Toggles made meanwhile collapse into one
+        # queued write of the latest requested state, whose outcome they all await.
+        self._write_lock = asyncio.Lock()
+        self._queued_state = False
+        self._queued_write: asyncio.Future[None] | None = None
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         if not super().available:
             return False
+        if self._available_fn is None:
+            return True
 
-        # Use device_name as the primary identifier passed to the lambda/function
-        identifier = self._device_name
-        return self.entity_description.available_fn(self.coordinator.data, identifier)
+        # Use device_name as the primary identifier passed to the function
+        return self._available_fn(self.coordinator.data, self._device_name)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        if self.coordinator.data is None:
+        return self._is_on_cache.get(self.coordinator.data)
+
+    def _compute_is_on(self, data: Optional[Dict[str, Any]]) -> bool | None:
+        """Compute the on/off state from coordinator data."""
+        if data is None:
             return None
-        identifier = self._device_name
-        return self.entity_description.is_on_fn(self.coordinator.data, identifier)
+        return self.entity_description.is_on_fn(self._select_device_data(data), self._device_name)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         if self.coordinator.data is None:
             raise HomeAssistantError(f"Cannot turn on {self.entity_id}: Coordinator data is unavailable")
-        identifier = self._device_name
-        await self.entity_description.turn_on_fn(self.coordinator, identifier)
+        await self._async_write_state(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         if self.coordinator.data is None:
             raise HomeAssistantError(f"Cannot turn off {self.entity_id}: Coordinator data is unavailable")
-        identifier = self._device_name
-        await self.entity_description.turn_off_fn(self.coordinator, identifier)
+        await self._async_write_state(False)
+
+    async def _async_write_state(self, turn_on: bool) -> None:
+        """Write the requested state, coalescing toggles made while a write is in flight."""
+        if self._queued_write is None:
+            self._queued_write = self.hass.loop.create_future()
+        queued_write = self._queued_write
+        self._queued_state = turn_on
+        if self._write_lock.locked():
+            _LOGGER.debug("Coalescing toggle of %s into the queued write", self.entity_id)
+            await asyncio.shield(queued_write)
+            return
+
+        async with self._write_lock:
+            try:
+                while self._queued_write is not None:
+                    write, self._queued_write = self._queued_write, None
+                    write_fn = (
+                        self.entity_description.turn_on_fn
+                        if self._queued_state
+                        else self.entity_description.turn_off_fn
+                    )
+                    try:
+                        # Use device_name as the primary identifier passed to the function
+                        await write_fn(self.coordinator, self._device_name)
+                    except asyncio.CancelledError:
+                        write.cancel()
+                        raise
+                    except Exception as ex:  # pylint: disable=broad-exception-caught
+                        # Reported to every caller that requested this write
+                        write.set_exception(ex)
+                    else:
+                        write.set_result(None)
+            finally:
+                # Only reached with a write still queued when this task was cancelled
+                if self._queued_write is not None:
+                    self._queued_write.cancel()
+                    self._queued_write = None
+        await queued_write